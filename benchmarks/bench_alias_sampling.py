@@ -0,0 +1,45 @@
+"""
+Compares the alias-table sampler with the bisect-based CDF sampler of ProbabilityDistribution
+across support sizes, for single draws (`sample()`) and batched draws (`sample(n)`).
+
+Run from the repository root:
+    python benchmarks/bench_alias_sampling.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathclasses import ProbabilityDistribution
+
+SUPPORT_SIZES = [10, 1000, 100000, 500000]
+SINGLE_DRAWS = 100000
+BATCH_DRAWS = 1000000
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'support':>8} {'sampler':>7} {'build (s)':>10} {'single (s)':>11} {'batch (s)':>10}")
+    for size in SUPPORT_SIZES:
+        probabilities = {i: (i % 97) + 1 for i in range(size)}
+        for sampler in ('cdf', 'alias'):
+            dist = None
+
+            def build():
+                nonlocal dist
+                dist = ProbabilityDistribution(probabilities, sampler=sampler)
+
+            build_time = time_it(build)
+            single_time = time_it(lambda: [dist.sample() for _ in range(SINGLE_DRAWS)])
+            batch_time = time_it(lambda: dist.sample(BATCH_DRAWS, rng=0))
+            print(f"{size:>8} {sampler:>7} {build_time:>10.4f} {single_time:>11.4f} {batch_time:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares elementwise multiplication, division and conjugation of complex signals stored as lists of
+ComplexNumber objects against ComplexArray, and times ComplexArray.fft.
+
+Run from the repository root:
+    python benchmarks/bench_complex.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathclasses import ComplexArray, ComplexNumber
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'size':>9} {'op':>5} {'ComplexNumber (s)':>18} {'ComplexArray (s)':>17} {'speedup':>8}")
+    for size in SIZES:
+        a = [ComplexNumber(random.random(), random.random()) for _ in range(size)]
+        b = [ComplexNumber(random.random() + 1, random.random()) for _ in range(size)]
+        fast_a, fast_b = ComplexArray(a), ComplexArray(b)
+        cases = [
+            ("mul", lambda: [x * y for x, y in zip(a, b)], lambda: fast_a * fast_b),
+            ("div", lambda: [x / y for x, y in zip(a, b)], lambda: fast_a / fast_b),
+            ("conj", lambda: [ComplexNumber(x.real, -x.imag) for x in a], fast_a.conjugate),
+        ]
+        for op, slow_func, fast_func in cases:
+            slow, fast = time_it(slow_func), time_it(fast_func)
+            print(f"{size:>9} {op:>5} {slow:>18.4f} {fast:>17.4f} {slow / fast:>7.0f}x")
+        print(f"{size:>9} {'fft':>5} {'-':>18} {time_it(fast_a.fft):>17.4f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
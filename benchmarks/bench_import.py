@@ -0,0 +1,89 @@
+"""
+Measures the cold-start import time of the mathclasses package and of every module in it, each in a
+fresh interpreter, and checks that importing has no side effects: nothing is printed, and neither
+matplotlib nor scipy is loaded.
+
+Exits with status 1 if any module takes longer than the budget (best of REPEATS runs) or has a side effect.
+
+Run from the repository root:
+    python benchmarks/bench_import.py [--budget SECONDS]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "mathclasses",
+    "mathclasses.fraction",
+    "mathclasses.complex_number",
+    "mathclasses.complex_array",
+    "mathclasses.polynomial",
+    "mathclasses.matrix",
+    "mathclasses.sparse_matrix",
+    "mathclasses.vector",
+    "mathclasses.vector_array",
+    "mathclasses.point2d",
+    "mathclasses.point_cloud",
+    "mathclasses.quaternion",
+    "mathclasses.quaternion_array",
+    "mathclasses.probability_distribution",
+]
+# Heavy optional dependencies that must only be imported on use (plot() and the distribution factories)
+LAZY_DEPENDENCIES = ["matplotlib", "scipy"]
+IMPORT_BUDGET = 0.5
+REPEATS = 5
+
+PROBE = """
+import contextlib, io, json, sys, time
+output = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(output):
+    import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "output": output.getvalue(),
+                  "loaded": [name for name in {lazy!r} if name in sys.modules]}}))
+"""
+
+
+def measure(module):
+    """
+    Imports `module` in REPEATS fresh interpreters and returns the fastest run's report.
+    """
+    runs = []
+    for _ in range(REPEATS):
+        completed = subprocess.run([sys.executable, "-c", PROBE.format(module=module, lazy=LAZY_DEPENDENCIES)],
+                                   cwd=ROOT, capture_output=True, text=True)
+        if completed.returncode != 0:
+            return {"seconds": float("inf"), "output": "", "loaded": [], "error": completed.stderr.strip()}
+        runs.append(json.loads(completed.stdout.splitlines()[-1]))
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET, help="Maximum import time per module (s)")
+    args = parser.parse_args()
+    failures = 0
+    print(f"{'module':<38} {'import (s)':>10}  status")
+    for module in MODULES:
+        report = measure(module)
+        problems = []
+        if "error" in report:
+            problems.append("import failed: " + report["error"].splitlines()[-1])
+        elif report["seconds"] > args.budget:
+            problems.append(f"over budget ({args.budget:.2f} s)")
+        if report["output"]:
+            problems.append("prints on import")
+        if report["loaded"]:
+            problems.append("loads " + ", ".join(report["loaded"]))
+        failures += bool(problems)
+        print(f"{module:<38} {report['seconds']:>10.4f}  {'; '.join(problems) or 'ok'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares Matrix multiplication, addition and scaling on the array backend against the original
+nested-list implementation at 64, 256 and 1024 rows.
+
+The nested-list reference takes minutes at 1024, so it is only run up to NAIVE_LIMIT.
+
+Run from the repository root:
+    python benchmarks/bench_matrix.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathclasses import Matrix
+
+SIZES = [64, 256, 1024]
+NAIVE_LIMIT = 256
+
+
+def naive_mul(a, b):
+    return [[sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))] for i in range(len(a))]
+
+
+def naive_add(a, b):
+    return [[a[i][j] + b[i][j] for j in range(len(a[0]))] for i in range(len(a))]
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'size':>5} {'op':>4} {'nested list (s)':>16} {'Matrix (s)':>11} {'speedup':>8}")
+    for size in SIZES:
+        a = [[random.random() for _ in range(size)] for _ in range(size)]
+        b = [[random.random() for _ in range(size)] for _ in range(size)]
+        ma, mb = Matrix(a), Matrix(b)
+        for op, naive, fast in (('mul', naive_mul, lambda: ma * mb), ('add', naive_add, lambda: ma + mb)):
+            fast_time = time_it(fast)
+            if size <= NAIVE_LIMIT:
+                naive_time = time_it(lambda: naive(a, b))
+                print(f"{size:>5} {op:>4} {naive_time:>16.4f} {fast_time:>11.4f} {naive_time / fast_time:>7.1f}x")
+            else:
+                print(f"{size:>5} {op:>4} {'skipped':>16} {fast_time:>11.4f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
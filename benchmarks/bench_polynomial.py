@@ -0,0 +1,108 @@
+"""
+Compares Polynomial.multipoint_evaluate and Polynomial.interpolate with the naive O(n^2) approaches:
+Horner's rule at every point, and Lagrange interpolation through synthetic division.
+
+Exact (integer / Fraction) inputs use Horner's rule at each point and Newton's divided differences on
+Fractions. Floating point inputs use the same methods vectorized with NumPy.
+
+It also checks that integer multiplication stays exact where the FFT path is taken or refused (coefficients
+up to 2^19 at 4096 terms) and exits with status 1 if a product differs from the exact big-integer one.
+
+Run from the repository root:
+    python benchmarks/bench_polynomial.py
+"""
+import os
+import random
+import sys
+import time
+import warnings
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathclasses import Polynomial
+
+EXACT_SIZES = [64, 128, 256]
+FLOAT_SIZES = [256, 1024, 4096]
+# (terms, largest coefficient) of the integer products checked for exactness
+MULTIPLY_CASES = [(4096, 9), (4096, 2 ** 15 - 1), (4096, 2 ** 19 - 1), (16384, 2 ** 10 - 1)]
+
+
+def naive_evaluate(poly, points):
+    return [poly(x) for x in points]
+
+
+def lagrange_interpolate(xs, ys, one):
+    # M(x) = prod(x - xi), built one factor at a time
+    master = [one]
+    for x in xs:
+        master = [a - x * b for a, b in zip(master + [0 * one], [0 * one] + master)]
+    result = [0 * one] * len(xs)
+    for xi, yi in zip(xs, ys):
+        # Synthetic division M(x) / (x - xi)
+        quotient = [master[0]]
+        for coeff in master[1:-1]:
+            quotient.append(coeff + xi * quotient[-1])
+        weight = yi * one / Polynomial(quotient)(xi)
+        result = [r + weight * q for r, q in zip(result, quotient)]
+    return Polynomial(result)
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(kind, n, poly, points, values, one):
+    naive = time_it(lambda: naive_evaluate(poly, points))
+    fast = time_it(lambda: poly.multipoint_evaluate(points))
+    print(f"{kind:>6} {n:>5} {'evaluate':>12} {naive:>10.4f} {fast:>9.4f}")
+    try:
+        naive = f"{time_it(lambda: lagrange_interpolate(points, values, one)):>10.4f}"
+    except ZeroDivisionError:
+        # The floating point product of the point differences underflows at high degree
+        naive = f"{'underflow':>10}"
+    fast = time_it(lambda: Polynomial.interpolate(points, values))
+    print(f"{kind:>6} {n:>5} {'interpolate':>12} {naive} {fast:>9.4f}")
+
+
+def check_multiply(n, bound):
+    a = [random.randint(-bound, bound) for _ in range(n - 1)] + [bound]
+    b = [random.randint(-bound, bound) for _ in range(n - 1)] + [bound]
+    # Worst case for the FFT round-off: every coefficient at the bound
+    for x, y in ((a, b), ([bound] * n, [bound] * n)):
+        product = []
+        elapsed = time_it(lambda: product.append((Polynomial(x) * Polynomial(y)).coefficients))
+        exact = product[0] == Polynomial._kronecker_mul(x, y)
+        print(f"{n:>6} {bound:>10} {elapsed:>9.4f} {'exact' if exact else 'WRONG':>7}")
+        if not exact:
+            return False
+    return True
+
+
+def main():
+    print(f"{'terms':>6} {'bound':>10} {'mul (s)':>9} {'result':>7}")
+    failures = sum(not check_multiply(n, bound) for n, bound in MULTIPLY_CASES)
+    print()
+    # High-degree floating point interpolation overflows in the monomial basis; only the timings matter here
+    warnings.filterwarnings('ignore', category=RuntimeWarning)
+    print(f"{'kind':>6} {'n':>5} {'task':>12} {'naive (s)':>10} {'fast (s)':>9}")
+    for n in EXACT_SIZES:
+        poly = Polynomial([random.randint(-9, 9) for _ in range(n)])
+        points = random.sample(range(-4 * n, 4 * n), n)
+        values = [random.randint(-9, 9) for _ in range(n)]
+        run('exact', n, poly, points, values, Fraction(1))
+    for n in FLOAT_SIZES:
+        poly = Polynomial([random.uniform(-1, 1) for _ in range(n)])
+        points = [random.uniform(-1, 1) for _ in range(n)]
+        values = [random.uniform(-1, 1) for _ in range(n)]
+        run('float', n, poly, points, values, 1.0)
+    if failures:
+        print(f"\n{failures} integer product(s) were not exact")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
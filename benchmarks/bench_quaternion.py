@@ -0,0 +1,57 @@
+"""
+Compares rotating 3D points with per-element Quaternion products (q * p * q^-1) against
+QuaternionArray.rotate, for one rotation applied to all points and for one rotation per point.
+
+The per-element reference is only run up to NAIVE_LIMIT points; larger sizes report QuaternionArray alone.
+
+Run from the repository root:
+    python benchmarks/bench_quaternion.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathclasses import Quaternion, QuaternionArray
+
+SIZES = [10_000, 100_000, 1_000_000]
+NAIVE_LIMIT = 100_000
+
+
+def naive_rotate(quaternions, points):
+    rotated = []
+    for q, (x, y, z) in zip(quaternions, points):
+        p = q * Quaternion(0.0, x, y, z) * q.conjugate()
+        rotated.append((p.x, p.y, p.z))
+    return rotated
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'points':>9} {'mode':>13} {'Quaternion (s)':>15} {'QuaternionArray (s)':>20} {'speedup':>8}")
+    for size in SIZES:
+        points = rng.normal(size=(size, 3))
+        many = QuaternionArray(array=rng.normal(size=(size, 4))).normalize()
+        one = QuaternionArray(array=many._array[:1])
+        for mode, rotations in (("one rotation", one), ("per point", many)):
+            fast = time_it(lambda: rotations.rotate(points))
+            if size <= NAIVE_LIMIT:
+                objects = [rotations[0]] * size if len(rotations) == 1 else list(rotations)
+                point_list = points.tolist()
+                slow = time_it(lambda: naive_rotate(objects, point_list))
+                print(f"{size:>9} {mode:>13} {slow:>15.4f} {fast:>20.4f} {slow / fast:>7.0f}x")
+            else:
+                print(f"{size:>9} {mode:>13} {'-':>15} {fast:>20.4f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
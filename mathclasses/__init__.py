@@ -0,0 +1,48 @@
+"""
+Mathematical classes: fractions, complex numbers, polynomials, matrices, vectors, points, quaternions
+and probability distributions, plus array-backed batch versions of several of them.
+
+Importing the package has no side effects and loads nothing heavy: each class is imported from its
+module on first attribute access (``mathclasses.Matrix``), and NumPy-backed modules only pull in NumPy
+at that point. Every module can also be imported directly, e.g. ``from mathclasses.matrix import Matrix``.
+"""
+import importlib
+
+# Public name -> module that defines it
+_EXPORTS = {
+    'Fraction': 'fraction',
+    'ComplexNumber': 'complex_number',
+    'ComplexArray': 'complex_array',
+    'Polynomial': 'polynomial',
+    'Matrix': 'matrix',
+    'MatrixExpression': 'matrix',
+    'SparseMatrix': 'sparse_matrix',
+    'Vector': 'vector',
+    'VectorArray': 'vector_array',
+    'Point2D': 'point2d',
+    'PointCloud': 'point_cloud',
+    'Quaternion': 'quaternion',
+    'QuaternionArray': 'quaternion_array',
+    'ProbabilityDistribution': 'probability_distribution',
+    'MonteCarloResult': 'probability_distribution',
+    'profile': 'profiling',
+    'Profile': 'profiling',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Imports the module defining `name` on first access and caches the attribute on the package.
+    """
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
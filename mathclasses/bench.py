@@ -0,0 +1,327 @@
+"""
+Benchmark runner for the mathclasses package.
+
+Every workload is a function that takes one size parameter, does its setup, and returns the
+callable to time together with the number of operations one call performs. The runner reports
+the best time per call, the throughput (operations per second) and the peak memory allocated
+by Python during one call. It can write the results as JSON and compare them with a baseline
+file, exiting with status 1 when a workload got slower than the tolerance allows.
+
+Run from the repository root:
+    python -m mathclasses.bench [--filter matrix] [--output results.json]
+                                [--baseline baseline.json] [--tolerance 0.25] [--update-baseline]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+
+def _fraction_add_chain(n):
+    from .fraction import Fraction
+    values = [Fraction(random.randint(1, 100), random.randint(1, 100)) for _ in range(n)]
+
+    def run():
+        total = Fraction(0, 1)
+        for value in values:
+            total = total + value
+        return total
+    return run, n
+
+
+def _fraction_sum(n):
+    from .fraction import Fraction
+    values = [Fraction(random.randint(1, 100), random.randint(1, 100)) for _ in range(n)]
+    return lambda: Fraction.sum(values), n
+
+
+def _fraction_solve(n):
+    from .fraction import Fraction
+    rows = [[Fraction(random.randint(-9, 9), random.randint(1, 5)) for _ in range(n)] for _ in range(n)]
+    b = [random.randint(-9, 9) for _ in range(n)]
+    return lambda: Fraction.solve(rows, b), n ** 3
+
+
+def _complex_number_mul(n):
+    from .complex_number import ComplexNumber
+    a = [ComplexNumber(random.random(), random.random()) for _ in range(n)]
+    b = [ComplexNumber(random.random(), random.random()) for _ in range(n)]
+    return lambda: [x * y for x, y in zip(a, b)], n
+
+
+def _complex_array_mul(n):
+    from .complex_array import ComplexArray
+    a = ComplexArray(real=[random.random() for _ in range(n)], imag=[random.random() for _ in range(n)])
+    b = ComplexArray(real=[random.random() for _ in range(n)], imag=[random.random() for _ in range(n)])
+    return lambda: a * b, n
+
+
+def _polynomial_add(n):
+    from .polynomial import Polynomial
+    a = Polynomial([random.randint(-100, 100) for _ in range(n)])
+    b = Polynomial([random.randint(-100, 100) for _ in range(n // 2)])
+    return lambda: a + b, n
+
+
+def _polynomial_mul(n):
+    from .polynomial import Polynomial
+    a = Polynomial([random.randint(-100, 100) for _ in range(n)])
+    b = Polynomial([random.randint(-100, 100) for _ in range(n)])
+    return lambda: a * b, n * n
+
+
+def _matrix_matmul(n):
+    from .matrix import Matrix
+    a = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    b = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    return lambda: a * b, 2 * n ** 3
+
+
+def _matrix_solve(n):
+    from .matrix import Matrix
+    rows = [[random.random() + (n if i == j else 0) for j in range(n)] for i in range(n)]
+    b = [random.random() for _ in range(n)]
+
+    def run():
+        # A fresh matrix per call, so the memoized factorization is part of the measurement
+        return Matrix(rows).solve(b)
+    return run, n ** 3
+
+
+def _vector_dot(n):
+    from .vector import Vector
+    a = [Vector(random.random(), random.random()) for _ in range(n)]
+    b = [Vector(random.random(), random.random()) for _ in range(n)]
+    return lambda: [x.dot(y) for x, y in zip(a, b)], n
+
+
+def _vector_array_dot(n):
+    from .vector_array import VectorArray
+    a = VectorArray(x=[random.random() for _ in range(n)], y=[random.random() for _ in range(n)])
+    b = VectorArray(x=[random.random() for _ in range(n)], y=[random.random() for _ in range(n)])
+    return lambda: a.dot(b), n
+
+
+def _point2d_distance(n):
+    from .point2d import Point2D
+    points = [Point2D(random.random(), random.random()) for _ in range(n)]
+    origin = Point2D(0.5, 0.5)
+    return lambda: [origin.distance_to(point) for point in points], n
+
+
+def _point_cloud_nearest(n):
+    from .point_cloud import PointCloud
+    cloud = PointCloud(x=[random.random() for _ in range(n)], y=[random.random() for _ in range(n)])
+    queries = [(random.random(), random.random()) for _ in range(1000)]
+    return lambda: [cloud.nearest(query, k=4) for query in queries], len(queries)
+
+
+def _quaternion_mul(n):
+    from .quaternion import Quaternion
+    a = [Quaternion(*(random.random() for _ in range(4))) for _ in range(n)]
+    b = [Quaternion(*(random.random() for _ in range(4))) for _ in range(n)]
+    return lambda: [x * y for x, y in zip(a, b)], n
+
+
+def _quaternion_array_rotate(n):
+    import numpy as np
+    from .quaternion_array import QuaternionArray
+    rotations = QuaternionArray(array=[[random.gauss(0, 1) for _ in range(4)] for _ in range(n)]).normalize()
+    points = np.array([[random.random() for _ in range(3)] for _ in range(n)])
+    return lambda: rotations.rotate(points), n
+
+
+def _distribution_normal(n):
+    from .probability_distribution import ProbabilityDistribution
+
+    def run():
+        # Clearing the table cache makes every call build (discretize and index) the distribution
+        ProbabilityDistribution.clear_cache()
+        return ProbabilityDistribution.normal(num_points=n)
+    return run, n
+
+
+def _distribution_sample(n):
+    from .probability_distribution import ProbabilityDistribution
+    distribution = ProbabilityDistribution.normal()
+    return lambda: distribution.sample_many(n), n
+
+
+# Workload name -> (setup function, sizes it runs at)
+WORKLOADS = {
+    'fraction.add_chain': (_fraction_add_chain, [1000, 10000]),
+    'fraction.sum': (_fraction_sum, [1000, 10000]),
+    'fraction.solve': (_fraction_solve, [20, 60]),
+    'complex_number.mul': (_complex_number_mul, [10000]),
+    'complex_array.mul': (_complex_array_mul, [10000, 1000000]),
+    'polynomial.add': (_polynomial_add, [1000, 100000]),
+    'polynomial.mul': (_polynomial_mul, [64, 1024]),
+    'matrix.matmul': (_matrix_matmul, [64, 256, 512]),
+    'matrix.solve': (_matrix_solve, [64, 256]),
+    'vector.dot': (_vector_dot, [10000]),
+    'vector_array.dot': (_vector_array_dot, [10000, 1000000]),
+    'point2d.distance': (_point2d_distance, [10000]),
+    'point_cloud.nearest': (_point_cloud_nearest, [10000, 100000]),
+    'quaternion.mul': (_quaternion_mul, [10000]),
+    'quaternion_array.rotate': (_quaternion_array_rotate, [10000, 100000]),
+    'probability_distribution.normal': (_distribution_normal, [1000, 100000]),
+    'probability_distribution.sample': (_distribution_sample, [1000, 1000000]),
+}
+
+
+def run_workload(name, size, min_time=0.2, repeat=3):
+    """
+    Times one workload at one size.
+
+    The callable runs at least `repeat` times and until `min_time` seconds have been spent; the
+    fastest call is reported. Peak memory is measured in one extra call under tracemalloc, so its
+    overhead does not affect the timings.
+
+    Returns:
+    - result (dict): Name, size, best seconds per call, throughput (operations per second) and peak bytes.
+    """
+    setup, _ = WORKLOADS[name]
+    random.seed(0)
+    func, operations = setup(size)
+    times = []
+    spent = 0.0
+    while len(times) < repeat or spent < min_time:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        spent += elapsed
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    best = min(times)
+    return {
+        'id': f'{name}[{size}]',
+        'name': name,
+        'size': size,
+        'calls': len(times),
+        'seconds': best,
+        'throughput': operations / best if best > 0 else float('inf'),
+        'peak_bytes': peak,
+    }
+
+
+def run(pattern=None, min_time=0.2, repeat=3, log=None):
+    """
+    Runs every workload whose name contains `pattern` (all of them by default) at all its sizes.
+
+    Parameters:
+    - log (function, optional): Called with each result as soon as it is available.
+
+    Returns:
+    - results (list): The result dictionaries, see `run_workload`.
+    """
+    results = []
+    for name, (_, sizes) in WORKLOADS.items():
+        if pattern and pattern not in name:
+            continue
+        for size in sizes:
+            result = run_workload(name, size, min_time, repeat)
+            results.append(result)
+            if log is not None:
+                log(result)
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares throughputs with a baseline report.
+
+    Parameters:
+    - results (list): Results of `run`.
+    - baseline (dict): A report written by this module (see `report`).
+    - tolerance (float): Allowed relative throughput loss, e.g. 0.25 flags anything more than 25% slower.
+
+    Returns:
+    - comparisons (list): (result id, baseline throughput or None, ratio or None, regressed) tuples.
+    """
+    previous = {entry['id']: entry for entry in baseline.get('results', [])}
+    comparisons = []
+    for result in results:
+        entry = previous.get(result['id'])
+        if entry is None:
+            comparisons.append((result['id'], None, None, False))
+            continue
+        ratio = result['throughput'] / entry['throughput']
+        comparisons.append((result['id'], entry['throughput'], ratio, ratio < 1 - tolerance))
+    return comparisons
+
+
+def report(results):
+    """
+    Wraps results with the interpreter and machine they were measured on, ready to be saved as JSON.
+    """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def _print_result(result):
+    print(f"{result['id']:<44} {result['seconds'] * 1e3:>11.3f} {result['throughput']:>14.4g} "
+          f"{result['peak_bytes'] / 2 ** 20:>9.2f}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m mathclasses.bench', description='Benchmark the mathclasses package.')
+    parser.add_argument('--filter', help='Only run workloads whose name contains this text')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--baseline', help='Compare with this JSON file written by an earlier run')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative throughput loss before a workload counts as regressed (default 0.25)')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results to the --baseline file')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds spent timing each workload')
+    parser.add_argument('--repeat', type=int, default=3, help='Minimum number of timed calls per workload')
+    parser.add_argument('--list', action='store_true', help='List the workloads and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, sizes) in WORKLOADS.items():
+            print(f"{name:<36} sizes {', '.join(map(str, sizes))}")
+        return 0
+    if args.update_baseline and not args.baseline:
+        parser.error('--update-baseline needs --baseline')
+
+    print(f"{'workload':<44} {'ms / call':>11} {'ops / s':>14} {'peak MiB':>9}")
+    results = run(args.filter, args.min_time, args.repeat, log=_print_result)
+    data = report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    status = 0
+    if args.baseline and not args.update_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparisons = compare(results, baseline, args.tolerance)
+        print(f"\n{'workload':<44} {'vs baseline':>11}")
+        for result_id, _, ratio, regressed in comparisons:
+            change = 'new' if ratio is None else f'{ratio:.2f}x'
+            print(f"{result_id:<44} {change:>11}{'  REGRESSION' if regressed else ''}")
+        regressions = sum(regressed for *_, regressed in comparisons)
+        if regressions:
+            print(f"\n{regressions} workload(s) regressed by more than {args.tolerance:.0%}")
+            status = 1
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(data, f, indent=2)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,224 @@
+from numbers import Complex
+
+import numpy as np
+from .complex_number import ComplexNumber
+
+
+class ComplexArray:
+    def __init__(self, numbers=None, real=None, imag=None):
+        """
+        Initializes a ComplexArray from an iterable of ComplexNumber objects, Python complex or real numbers, or
+        from the arrays of real parts `real` and imaginary parts `imag`.
+
+        The values are stored in one contiguous float64 buffer with interleaved parts (re0, im0, re1, im1, ...),
+        which is exactly the memory layout of a numpy.complex128 array, so conversions share the buffer.
+        """
+        if numbers is not None:
+            values = np.array([complex(number) for number in numbers], dtype=np.complex128)
+        else:
+            real = np.asarray([] if real is None else real, dtype=float)
+            imag = np.zeros_like(real) if imag is None else np.asarray(imag, dtype=float)
+            if real.shape != imag.shape or real.ndim != 1:
+                raise ValueError("real and imag must be 1-D arrays of the same length")
+            values = np.empty(len(real), dtype=np.complex128)
+            values.real = real
+            values.imag = imag
+        self._data = values.view(np.float64)
+
+    @classmethod
+    def from_numpy(cls, values):
+        """
+        Creates a ComplexArray from a 1-D NumPy array. A contiguous complex128 array is wrapped without copying
+        (both objects then see each other's writes); anything else is converted first.
+        """
+        values = np.ascontiguousarray(values, dtype=np.complex128)
+        if values.ndim != 1:
+            raise ValueError("ComplexArray holds 1-D data")
+        numbers = cls.__new__(cls)
+        numbers._data = values.view(np.float64)
+        return numbers
+
+    def to_numpy(self):
+        """
+        Returns the values as a complex128 NumPy array sharing this buffer (no copy).
+        """
+        return self._data.view(np.complex128)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Returns the values as a complex128 NumPy array sharing this buffer, so NumPy functions accept a ComplexArray.
+        A copy is returned when NumPy asks for one (`copy=True`, as `np.array(values)` does) or another dtype is
+        requested.
+        """
+        values = self.to_numpy()
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            if copy is False:
+                raise ValueError("Converting a ComplexArray to another dtype requires a copy")
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    @property
+    def buffer(self):
+        """
+        Returns the interleaved float64 buffer (re0, im0, re1, im1, ...) as an ndarray view.
+        """
+        return self._data
+
+    @property
+    def real(self):
+        """
+        Returns the real parts as a strided view of the buffer.
+        """
+        return self._data[0::2]
+
+    @property
+    def imag(self):
+        """
+        Returns the imaginary parts as a strided view of the buffer.
+        """
+        return self._data[1::2]
+
+    def __len__(self):
+        """
+        Returns the number of values.
+        """
+        return len(self._data) // 2
+
+    def __getitem__(self, i):
+        """
+        Returns value `i` as a ComplexNumber object.
+        """
+        value = self.to_numpy()[i]
+        return ComplexNumber(float(value.real), float(value.imag))
+
+    def __setitem__(self, i, value):
+        """
+        Sets value `i` from a ComplexNumber object, a Python complex or a real number.
+        """
+        self.to_numpy()[i] = complex(value)
+
+    def __iter__(self):
+        """
+        Iterates over the values as ComplexNumber objects.
+        """
+        return (ComplexNumber(value.real, value.imag) for value in self.to_numpy().tolist())
+
+    def _operand(self, other):
+        """
+        Returns `other` as a complex128 array or a Python complex that broadcasts against the values, or None
+        for unsupported operands.
+        """
+        if isinstance(other, ComplexArray):
+            if len(other) != len(self):
+                raise ValueError("ComplexArrays must have the same length")
+            return other.to_numpy()
+        if isinstance(other, (ComplexNumber, Complex)):
+            return complex(other)
+        return None
+
+    def _binary(self, other, op, reflected=False):
+        """
+        Applies the NumPy ufunc `op` to the values and `other`, writing into the buffer of a new ComplexArray.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        out = np.empty(len(self), dtype=np.complex128)
+        if reflected:
+            op(operand, self.to_numpy(), out=out)
+        else:
+            op(self.to_numpy(), operand, out=out)
+        return ComplexArray.from_numpy(out)
+
+    def __add__(self, other):
+        """
+        Adds a ComplexArray (elementwise), a ComplexNumber, a Python complex or a real number.
+        """
+        return self._binary(other, np.add)
+
+    def __radd__(self, other):
+        """
+        Adds the values to a ComplexNumber, a Python complex or a real number.
+        """
+        return self._binary(other, np.add, reflected=True)
+
+    def __sub__(self, other):
+        """
+        Subtracts a ComplexArray (elementwise), a ComplexNumber, a Python complex or a real number.
+        """
+        return self._binary(other, np.subtract)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the values from a ComplexNumber, a Python complex or a real number.
+        """
+        return self._binary(other, np.subtract, reflected=True)
+
+    def __mul__(self, other):
+        """
+        Multiplies by a ComplexArray (elementwise), a ComplexNumber, a Python complex or a real number.
+        """
+        return self._binary(other, np.multiply)
+
+    def __rmul__(self, other):
+        """
+        Multiplies a ComplexNumber, a Python complex or a real number by the values.
+        """
+        return self._binary(other, np.multiply, reflected=True)
+
+    def __truediv__(self, other):
+        """
+        Divides by a ComplexArray (elementwise), a ComplexNumber, a Python complex or a real number.
+        Division by zero gives inf/nan entries (with a NumPy RuntimeWarning) instead of raising.
+        """
+        return self._binary(other, np.divide)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a ComplexNumber, a Python complex or a real number by the values.
+        """
+        return self._binary(other, np.divide, reflected=True)
+
+    def __abs__(self):
+        """
+        Returns the magnitudes as a float64 ndarray.
+        """
+        return np.abs(self.to_numpy())
+
+    def conjugate(self):
+        """
+        Returns the complex conjugates as a new ComplexArray.
+        """
+        return ComplexArray.from_numpy(np.conjugate(self.to_numpy()))
+
+    def exp(self):
+        """
+        Returns e raised to every value as a new ComplexArray.
+        """
+        return ComplexArray.from_numpy(np.exp(self.to_numpy()))
+
+    def fft(self, n=None):
+        """
+        Returns the discrete Fourier transform of the values as a new ComplexArray.
+
+        Parameters:
+        - n (int, optional): Transform length; the values are cropped or zero-padded to it.
+        """
+        return ComplexArray.from_numpy(np.fft.fft(self.to_numpy(), n))
+
+    def ifft(self, n=None):
+        """
+        Returns the inverse discrete Fourier transform of the values as a new ComplexArray (ifft(fft(a)) == a).
+        """
+        return ComplexArray.from_numpy(np.fft.ifft(self.to_numpy(), n))
+
+    def __str__(self):
+        """
+        Returns a string representation of the ComplexArray object.
+        """
+        return "[" + ", ".join(map(str, self)) + "]"
+
+if __name__ == "__main__":
+    # Example usage:
+    signal = ComplexArray([1, 2 + 1j, ComplexNumber(0, -1)])
+    print(signal * (1 + 1j))  # Output: [1.0 + 1.0i, 1.0 + 3.0i, 1.0 + -1.0i]
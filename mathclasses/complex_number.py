@@ -0,0 +1,111 @@
+from numbers import Complex
+
+
+class ComplexNumber:
+    def __init__(self, real, imag):
+        """
+        Initializes a complex number with a real part `real` and an imaginary part `imag`.
+        """
+        self.real = real
+        self.imag = imag
+
+    @staticmethod
+    def _parts(other):
+        """
+        Returns the (real, imag) parts of a ComplexNumber, a Python complex or a real number, or None for
+        anything else.
+        """
+        if isinstance(other, (ComplexNumber, Complex)):
+            return other.real, other.imag
+        return None
+
+    def __add__(self, other):
+        """
+        Adds a ComplexNumber, a Python complex or a real number and returns a new ComplexNumber object with the sum.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexNumber(self.real + parts[0], self.imag + parts[1])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a ComplexNumber, a Python complex or a real number and returns a new ComplexNumber object with
+        the difference.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexNumber(self.real - parts[0], self.imag - parts[1])
+
+    def __rsub__(self, other):
+        """
+        Subtracts the complex number from a Python complex or a real number.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexNumber(parts[0] - self.real, parts[1] - self.imag)
+
+    def __mul__(self, other):
+        """
+        Multiplies two complex numbers using the formula (a + bi) * (c + di) = (ac - bd) + (ad + bc)i
+        and returns a new ComplexNumber object with the product. `other` can also be a Python complex or a real number.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        real = self.real * c - self.imag * d
+        imag = self.real * d + self.imag * c
+        return ComplexNumber(real, imag)
+
+    __rmul__ = __mul__
+
+    @staticmethod
+    def _divide(a, b, c, d):
+        """
+        Returns (a + bi) / (c + di) as a new ComplexNumber object.
+        """
+        denom = c**2 + d**2
+        return ComplexNumber((a * c + b * d) / denom, (b * c - a * d) / denom)
+
+    def __truediv__(self, other):
+        """
+        Divides two complex numbers using the formula (a + bi) / (c + di) = ((ac + bd) / (c^2 + d^2))
+        + ((bc - ad) / (c^2 + d^2))i and returns a new ComplexNumber object with the quotient.
+        `other` can also be a Python complex or a real number.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._divide(self.real, self.imag, *parts)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a Python complex or a real number by the complex number.
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._divide(parts[0], parts[1], self.real, self.imag)
+
+    def __complex__(self):
+        """
+        Converts the complex number to a Python complex.
+        """
+        return complex(self.real, self.imag)
+
+    def __str__(self):
+        """
+        Returns a string representation of the complex number in the format "real + imagi".
+        """
+        return f"{self.real} + {self.imag}i"
+
+if __name__ == "__main__":
+    # Example usage:
+    c1 = ComplexNumber(2, 3)
+    c2 = ComplexNumber(1, 4)
+    print(c1 + c2)  # Output: 3 + 7i
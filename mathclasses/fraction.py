@@ -0,0 +1,397 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # Exact solve and det then always use Bareiss elimination
+    np = None
+
+class Fraction:
+    # Results whose reduced numerator and denominator both lie within this bound are interned (shared)
+    INTERN_LIMIT = 64
+    _interned = {}
+    # Exact systems with at least this many unknowns are solved modulo word-sized primes when NumPy is available
+    MODULAR_THRESHOLD = 50
+    _primes = []
+    # Fractions are immutable: interned results are shared, so changing one in place would change every use of it
+    __slots__ = ('_n', '_d')
+
+    # Initialize the fraction with numerator `n` and denominator `d`, simplifying it if possible.
+    def __init__(self, n, d):
+        if d == 0:
+            raise ValueError("Denominator cannot be zero")  # Handle the case where the denominator is zero.
+        self._n = n
+        self._d = d
+        self.simplify()
+
+    # The numerator and denominator are read-only.
+    @property
+    def n(self):
+        return self._n
+
+    @property
+    def d(self):
+        return self._d
+
+    # Build the result of an operation from an already reduced n/d with d > 0, skipping the GCD in __init__.
+    # Small results come from the intern cache, so common values like 1/2 are not allocated again.
+    @classmethod
+    def _make(cls, n, d):
+        limit = cls.INTERN_LIMIT
+        if -limit <= n <= limit and d <= limit:
+            key = (n, d)
+            fraction = cls._interned.get(key)
+            if fraction is None:
+                fraction = cls._interned[key] = cls._new(n, d)
+            return fraction
+        return cls._new(n, d)
+
+    @classmethod
+    def _new(cls, n, d):
+        fraction = cls.__new__(cls)
+        fraction._n = n
+        fraction._d = d
+        return fraction
+
+    # Reduce n/d (d != 0) once and return it through `_make`.
+    @classmethod
+    def _reduced(cls, n, d):
+        gcd = math.gcd(n, d)
+        if d < 0:
+            gcd = -gcd
+        return cls._make(n // gcd, d // gcd)
+
+    # Return the (numerator, denominator) of a Fraction or an int operand, or None for anything else.
+    @staticmethod
+    def _operand(other):
+        if isinstance(other, Fraction):
+            return other._n, other._d
+        if isinstance(other, int):
+            return other, 1
+        return None
+
+    # Return a string representation of the fraction in the format "n/d".
+    def __str__(self):
+        return f"{self._n}/{self._d}"
+
+    # Add reduced fractions a/b + c/d. Equal denominators only need a single GCD on the numerator sum;
+    # otherwise g = gcd(b, d) lets the GCD run on small cofactors instead of the full cross products.
+    @staticmethod
+    def _add(a, b, c, d):
+        if b == d:
+            return Fraction._reduced(a + c, b)
+        g = math.gcd(b, d)
+        if g == 1:
+            return Fraction._make(a * d + c * b, b * d)
+        s = b // g
+        t = a * (d // g) + c * s
+        g2 = math.gcd(t, g)
+        return Fraction._make(t // g2, s * (d // g2))
+
+    # Perform addition of two fractions (or a fraction and an int) and return a new Fraction object as the result.
+    def __add__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._add(self._n, self._d, *operand)
+
+    __radd__ = __add__
+
+    # Perform subtraction of two fractions (or a fraction and an int) and return a new Fraction object as the result.
+    def __sub__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._add(self._n, self._d, -operand[0], operand[1])
+
+    def __rsub__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._add(operand[0], operand[1], -self._n, self._d)
+
+    # Multiply reduced fractions a/b * c/d, cancelling a against d and c against b first so the
+    # product is already reduced.
+    @staticmethod
+    def _mul(a, b, c, d):
+        g1 = math.gcd(a, d)
+        g2 = math.gcd(c, b)
+        n = (a // g1) * (c // g2)
+        den = (b // g2) * (d // g1)
+        if den < 0:
+            n, den = -n, -den
+        return Fraction._make(n, den)
+
+    # Perform multiplication of two fractions (or a fraction and an int) and return a new Fraction object as the result.
+    def __mul__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self._mul(self._n, self._d, *operand)
+
+    __rmul__ = __mul__
+
+    # Perform true division of two fractions (or a fraction and an int) and return a new Fraction object as the result.
+    def __truediv__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if operand[0] == 0:
+            raise ValueError("Cannot divide by a fraction with a numerator of zero")  # Handle division by zero error.
+        return self._mul(self._n, self._d, operand[1], operand[0])
+
+    def __rtruediv__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if self._n == 0:
+            raise ValueError("Cannot divide by a fraction with a numerator of zero")
+        return self._mul(operand[0], operand[1], self._d, self._n)
+
+    # Simplify the fraction using the greatest common divisor (GCD), keeping the denominator positive.
+    # Every Fraction is reduced when it is created, so afterwards this leaves the value unchanged.
+    def simplify(self):
+        gcd = math.gcd(self._n, self._d)
+        if self._d < 0:
+            gcd = -gcd
+        self._n //= gcd
+        self._d //= gcd
+
+    # Sum an iterable of fractions and ints with a single reduction at the end: numerators are first
+    # accumulated per denominator, then brought to the LCM of the distinct denominators.
+    @staticmethod
+    def sum(fractions):
+        numerators = {}
+        for fraction in fractions:
+            n, d = Fraction._operand(fraction) or (None, None)
+            if n is None:
+                raise TypeError("Fraction.sum expects Fraction or int values")
+            numerators[d] = numerators.get(d, 0) + n
+        if not numerators:
+            return Fraction._make(0, 1)
+        common = math.lcm(*numerators)
+        total = 0
+        for d, n in numerators.items():
+            total += n * (common // d)
+        return Fraction._reduced(total, common)
+
+    # Multiply an iterable of fractions and ints with a single reduction at the end.
+    @staticmethod
+    def prod(fractions):
+        numerators = []
+        denominators = []
+        for fraction in fractions:
+            n, d = Fraction._operand(fraction) or (None, None)
+            if n is None:
+                raise TypeError("Fraction.prod expects Fraction or int values")
+            numerators.append(n)
+            denominators.append(d)
+        return Fraction._reduced(Fraction._product(numerators), Fraction._product(denominators))
+
+    # Multiply a list of ints pairwise (a balanced product tree), so large factors meet only at the top.
+    @staticmethod
+    def _product(values):
+        if not values:
+            return 1
+        while len(values) > 1:
+            values = [values[i] * values[i + 1] if i + 1 < len(values) else values[i] for i in range(0, len(values), 2)]
+        return values[0]
+
+    # Return the rows of a square Matrix object or 2D list of ints / Fractions, each scaled to integers by the
+    # LCM of its denominators, together with those scale factors.
+    @staticmethod
+    def _integer_rows(matrix, b=None):
+        rows = matrix.data if hasattr(matrix, 'data') else matrix
+        if any(len(row) != len(rows) for row in rows):
+            raise ValueError("Matrix must be square")
+        if b is not None and len(b) != len(rows):
+            raise ValueError("Right-hand side must have as many rows as the matrix")
+        scaled = []
+        scales = []
+        for i, row in enumerate(rows):
+            entries = list(row) if b is None else list(row) + [b[i]]
+            pairs = [Fraction._operand(value) for value in entries]
+            if None in pairs:
+                raise TypeError("Exact elimination expects Fraction or int elements")
+            scale = math.lcm(*(d for _, d in pairs))
+            scaled.append([n * (scale // d) for n, d in pairs])
+            scales.append(scale)
+        return scaled, scales
+
+    # Fraction-free Bareiss elimination to upper triangular form, in place. Every division is exact, so the
+    # entries stay integers no larger than minors of the input and no GCDs are needed.
+    # Returns the sign of the row permutation, or 0 if the matrix is singular.
+    @staticmethod
+    def _bareiss(rows, n):
+        sign = 1
+        previous = 1
+        for k in range(n):
+            pivot = next((i for i in range(k, n) if rows[i][k]), None)
+            if pivot is None:
+                return 0
+            if pivot != k:
+                rows[k], rows[pivot] = rows[pivot], rows[k]
+                sign = -sign
+            pivot_row = rows[k]
+            p = pivot_row[k]
+            tail = pivot_row[k + 1:]
+            for i in range(k + 1, n):
+                row = rows[i]
+                f = row[k]
+                if f:
+                    row[k + 1:] = [(x * p - f * y) // previous for x, y in zip(row[k + 1:], tail)]
+                elif p != previous:
+                    row[k + 1:] = [x * p // previous for x in row[k + 1:]]
+                row[k] = 0
+            previous = p
+        return sign
+
+    # Deterministic Miller-Rabin test, exact for n < 3,215,031,751 with bases 2, 3, 5 and 7.
+    @staticmethod
+    def _is_prime(n):
+        if n < 2 or n % 2 == 0:
+            return n == 2
+        d, r = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            r += 1
+        for a in (2, 3, 5, 7):
+            if a % n == 0:
+                continue
+            x = pow(a, d, n)
+            if x in (1, n - 1):
+                continue
+            for _ in range(r - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    # Return the i-th largest prime below 2^31 (products of two residues then fit in int64), extending the list lazily.
+    @classmethod
+    def _prime(cls, i):
+        candidate = cls._primes[-1] - 2 if cls._primes else 2 ** 31 - 1
+        while len(cls._primes) <= i:
+            if cls._is_prime(candidate):
+                cls._primes.append(candidate)
+            candidate -= 2
+        return cls._primes[i]
+
+    # Gaussian elimination of the integer rows modulo the prime p with NumPy int64 arithmetic.
+    # Returns det(A) mod p and, when the rows carry a right-hand side column, det(A) * x mod p
+    # (the Cramer numerators); returns None if A is singular modulo p.
+    @staticmethod
+    def _eliminate_mod(table, p, n):
+        M = table % p
+        det = 1
+        for k in range(n):
+            nonzero = np.flatnonzero(M[k:, k])
+            if not len(nonzero):
+                return None
+            pivot = k + int(nonzero[0])
+            if pivot != k:
+                M[[k, pivot]] = M[[pivot, k]]
+                det = -det
+            value = int(M[k, k])
+            det = det * value % p
+            M[k, k + 1:] = M[k, k + 1:] * pow(value, -1, p) % p
+            if k + 1 < n:
+                M[k + 1:, k + 1:] = (M[k + 1:, k + 1:] - M[k + 1:, k:k + 1] * M[k, k + 1:]) % p
+        if M.shape[1] == n:
+            return det, None
+        x = M[:, n].copy()
+        for j in range(n - 1, 0, -1):
+            x[:j] = (x[:j] - M[:j, j] * x[j]) % p
+        return det, (x * det % p).tolist()
+
+    # Exact elimination by Chinese remaindering: det(A) and the Cramer numerators det(A) * x_i are
+    # computed modulo enough primes to exceed twice their Hadamard bound, then recombined.
+    # Returns (det, numerators) or None when some prime divides det(A) (the caller then uses Bareiss).
+    # The bound, and so the number of primes, grows with the size of the scaled entries as well as with n.
+    @staticmethod
+    def _modular(rows, n):
+        bound_bits = 1
+        for row in rows:
+            bound_bits += (sum(value * value for value in row).bit_length() + 1) // 2
+        # Entries that fit in int64 are converted once; larger ones are reduced by Python for every prime
+        fits = max(abs(value) for row in rows for value in row) < 2 ** 62
+        table = np.array(rows, dtype=np.int64) if fits else None
+        values = None
+        modulus = 1
+        i = 0
+        while modulus.bit_length() <= bound_bits:
+            p = Fraction._prime(i)
+            i += 1
+            if not fits:
+                table = np.array([[value % p for value in row] for row in rows], dtype=np.int64)
+            residues = Fraction._eliminate_mod(table, p, n)
+            if residues is None:
+                return None
+            det, numerators = residues
+            residues = [det] + (numerators or [])
+            if values is None:
+                values = residues
+            else:
+                inverse = pow(modulus % p, -1, p)
+                values = [v + modulus * ((r - v) * inverse % p) for v, r in zip(values, residues)]
+            modulus *= p
+        half = modulus // 2
+        values = [v - modulus if v > half else v for v in values]
+        return values[0], values[1:]
+
+    # Compute the exact determinant of a square Matrix object or 2D list of ints / Fractions with Bareiss
+    # elimination, returning a Fraction.
+    @staticmethod
+    def det(matrix):
+        rows, scales = Fraction._integer_rows(matrix)
+        n = len(rows)
+        if n == 0:
+            return Fraction._make(1, 1)
+        scale = Fraction._product(scales)
+        if np is not None and n >= Fraction.MODULAR_THRESHOLD:
+            result = Fraction._modular(rows, n)
+            if result is not None:
+                return Fraction._reduced(result[0], scale)
+        sign = Fraction._bareiss(rows, n)
+        return Fraction._reduced(sign * rows[-1][-1], scale)
+
+    # Solve A * x = b exactly for a square Matrix object or 2D list `matrix` of ints / Fractions and a list `b`,
+    # returning x as a list of Fractions. Large systems go through `_modular`; otherwise (and whenever a
+    # prime divides the determinant) Bareiss elimination runs on the augmented integer matrix [A | b];
+    # the back substitution then works on the integers D * x_i (D = last pivot), which Cramer's rule
+    # guarantees to be whole numbers, so only the final n fractions are reduced.
+    # Raises a ValueError if the matrix is singular.
+    @staticmethod
+    def solve(matrix, b):
+        rows, _ = Fraction._integer_rows(matrix, b)
+        n = len(rows)
+        if np is not None and n >= Fraction.MODULAR_THRESHOLD:
+            result = Fraction._modular(rows, n)
+            if result is not None:
+                D, numerators = result
+                return [Fraction._reduced(value, D) for value in numerators]
+        if Fraction._bareiss(rows, n) == 0:
+            raise ValueError("Matrix is singular")
+        if n == 0:
+            return []
+        D = rows[-1][-2]
+        y = [0] * n
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            total = row[n] * D
+            for j in range(i + 1, n):
+                if row[j]:
+                    total -= row[j] * y[j]
+            y[i] = total // row[i]
+        return [Fraction._reduced(value, D) for value in y]
+
+if __name__ == "__main__":
+    x = Fraction(6, 7)
+    y = Fraction(2, 3)
+    print(x + y)  # Output: 32/21
+
+    try:
+        z = Fraction(1, 0)  # This raises a ValueError due to division by zero
+    except ValueError as e:
+        print(e)  # Output: Denominator cannot be zero
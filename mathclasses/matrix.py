@@ -0,0 +1,679 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+from operator import add, mul, sub
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to flat row-major storage: array('d') for floats, a list otherwise
+    np = None
+
+# Integer results at least this large do not fit in int64 and are computed on Python ints instead
+INT64_LIMIT = 2 ** 63
+
+
+def _attach_shared(name):
+    """
+    Attaches to an existing shared memory block owned (and later unlinked) by the parent process.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track` argument; pool workers share the parent's tracker
+        return shared_memory.SharedMemory(name=name)
+
+
+def _matmul_rows(a_spec, b_spec, c_spec, start, stop):
+    """
+    Computes rows `start:stop` of C = A x B, with A, B and C living in shared memory.
+
+    Each spec is a (shared memory name, shape, dtype string) tuple.
+    """
+    blocks = [_attach_shared(name) for name, _, _ in (a_spec, b_spec, c_spec)]
+    try:
+        a, b, c = (np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                   for block, (_, shape, dtype) in zip(blocks, (a_spec, b_spec, c_spec)))
+        np.matmul(a[start:stop], b, out=c[start:stop])
+        del a, b, c
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class Matrix:
+    # Tile edge used by the pure-Python multiplication kernel when NumPy is not available
+    BLOCK_SIZE = 64
+    # Products with fewer than PARALLEL_THRESHOLD ** 3 multiply-adds are always computed serially
+    PARALLEL_THRESHOLD = 512
+
+    def __init__(self, data):
+        """
+        Initializes a Matrix object with the given 2D list `data`.
+        Sets attributes `rows` and `cols` based on the dimensions of the matrix.
+
+        The values are copied into contiguous storage: a NumPy ndarray, or a flat row-major
+        `array('d')` (a list for ints, complex numbers, Fractions, ...) when NumPy is not installed.
+        Integers beyond int64 are kept as an object array of Python ints, so they stay exact.
+        """
+        self.rows = len(data)
+        self.cols = len(data[0])
+        if np is not None:
+            values = np.array(data)
+            if values.ndim != 2:
+                raise ValueError("Matrix rows must all have the same length")
+            # NumPy turns ints of 2^63 and more into uint64 or (rounded) float64
+            if values.dtype.kind == 'u' or (values.dtype.kind == 'f' and values.size
+                                            and np.abs(values).max() >= INT64_LIMIT):
+                if any(isinstance(value, int) for row in data for value in row):
+                    values = np.array(data, dtype=object)
+            self._array = values
+        else:
+            flat = [value for row in data for value in row]
+            if len(flat) != self.rows * self.cols:
+                raise ValueError("Matrix rows must all have the same length")
+            self._array = self._flat(flat)
+        self._lu = None  # Memoized LU factorization, see `_factorize`
+
+    @staticmethod
+    def _flat(values):
+        """
+        Returns flat storage for a list of values when NumPy is not installed: array('d') when they are all floats,
+        otherwise the list itself, so ints stay exact and complex numbers or Fractions are kept as they are.
+        """
+        if values and all(type(value) is float for value in values):
+            return array('d', values)
+        return values
+
+    @staticmethod
+    def _magnitude(values):
+        """
+        Returns the largest absolute value of an integer ndarray as a Python int (0 when it is empty).
+        """
+        if not values.size:
+            return 0
+        return max(int(values.max()), -int(values.min()))
+
+    @staticmethod
+    def _exact(values, bound):
+        """
+        Returns integer storage unchanged when results up to `bound` in magnitude fit in int64, and as an
+        object array of Python ints otherwise, so integer arithmetic never wraps around.
+        """
+        if values.dtype.kind in 'iu' and bound >= INT64_LIMIT:
+            return values.astype(object)
+        return values
+
+    def _integer_operands(self, other, bound):
+        """
+        Returns the storage of both matrices, widened with `_exact` when both are integer and a result could
+        reach `bound(largest magnitude in self, largest magnitude in other)`.
+        """
+        a, b = self._array, other._array
+        if a.dtype.kind in 'iu' and b.dtype.kind in 'iu':
+            limit = bound(self._magnitude(a), self._magnitude(b))
+            a, b = self._exact(a, limit), self._exact(b, limit)
+        return a, b
+
+    @classmethod
+    def _from_array(cls, values, rows, cols):
+        """
+        Wraps already computed storage in a new Matrix object without copying it.
+        """
+        matrix = cls.__new__(cls)
+        matrix._array = values
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix._lu = None
+        return matrix
+
+    @property
+    def data(self):
+        """
+        Returns the matrix as a new 2D list.
+
+        The list is a copy: changing it (`matrix.data[i][j] = value`) does not change the matrix. Use
+        `matrix[i, j] = value`, or assign a whole new 2D list to `matrix.data`.
+        """
+        if np is not None:
+            return self._array.tolist()
+        return [list(self._array[i * self.cols:(i + 1) * self.cols]) for i in range(self.rows)]
+
+    @data.setter
+    def data(self, data):
+        """
+        Replaces all elements with those of the 2D list `data`.
+        """
+        Matrix.__init__(self, data)
+
+    def __getitem__(self, index):
+        """
+        Returns the element at `matrix[i, j]`.
+        """
+        i, j = index
+        if np is not None:
+            value = self._array[i, j]
+            return value.item() if isinstance(value, np.generic) else value
+        return self._array[i * self.cols + j]
+
+    def __setitem__(self, index, value):
+        """
+        Sets the element at `matrix[i, j]`.
+        """
+        i, j = index
+        if np is not None:
+            if isinstance(value, int) and not -INT64_LIMIT <= value < INT64_LIMIT:
+                dtype = np.dtype(object)
+            else:
+                dtype = np.result_type(self._array, np.asarray(value))
+            if dtype != self._array.dtype:
+                # Widen the storage (e.g. int to float, or to object for a Fraction) instead of truncating the value
+                self._array = self._array.astype(dtype)
+            self._array[i, j] = value
+        else:
+            if isinstance(self._array, array) and type(value) is not float:
+                self._array = list(self._array)
+            self._array[i * self.cols + j] = value
+        self._lu = None
+
+    def _elementwise(self, other, op):
+        """
+        Applies the binary operator `op` to every pair of corresponding elements in one vectorized pass.
+        """
+        if np is not None:
+            a, b = self._integer_operands(other, add)
+            return Matrix._from_array(op(a, b), self.rows, self.cols)
+        return Matrix._from_array(self._flat(list(map(op, self._array, other._array))), self.rows, self.cols)
+
+    def __add__(self, other):
+        """
+        Adds two Matrix objects and returns a new Matrix object with the result.
+        Raises a ValueError if matrices have different dimensions.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrices must have the same dimensions for addition")
+        return self._elementwise(other, add)
+
+    def __sub__(self, other):
+        """
+        Subtracts one Matrix object from another and returns a new Matrix object with the result.
+        Raises a ValueError if matrices have different dimensions.
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrices must have the same dimensions for subtraction")
+        return self._elementwise(other, sub)
+
+    def _scale(self, scalar):
+        """
+        Multiplies every element by `scalar` and returns a new Matrix object with the result.
+        """
+        if np is not None:
+            values = self._array
+            if isinstance(scalar, int) and values.dtype.kind in 'iu':
+                values = self._exact(values, self._magnitude(values) * abs(scalar))
+            return Matrix._from_array(values * scalar, self.rows, self.cols)
+        return Matrix._from_array(self._flat(list(map(mul, self._array, repeat(scalar)))), self.rows, self.cols)
+
+    def __mul__(self, other):
+        """
+        Multiplies two Matrix objects and returns a new Matrix object with the result.
+        Multiplying by a number scales every element instead.
+        Raises a ValueError if matrices are not compatible for multiplication.
+        """
+        if isinstance(other, (int, float)):
+            return self._scale(other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError("Matrices must be compatible for multiplication")
+        if np is not None:
+            a, b = self._integer_operands(other, lambda x, y: x * y * self.cols)
+            return Matrix._from_array(a @ b, self.rows, other.cols)
+        return Matrix._from_array(self._tiled_matmul(other), self.rows, other.cols)
+
+    def __rmul__(self, other):
+        """
+        Scales the matrix when it is multiplied from the left by a number.
+        """
+        if isinstance(other, (int, float)):
+            return self._scale(other)
+        return NotImplemented
+
+    def matmul_plan(self, other, workers=None):
+        """
+        Returns how `matmul` would partition the product with `other`.
+
+        Parameters:
+        - other (Matrix): Right-hand operand.
+        - workers (int, optional): Number of worker processes, defaults to the number of CPUs.
+
+        Returns:
+        - plan (dict): 'mode' ('serial' or 'parallel'), 'workers' and 'blocks', the list of (start, stop)
+          result row ranges computed by each task.
+        """
+        workers = workers or os.cpu_count() or 1
+        serial = {'mode': 'serial', 'workers': 1, 'blocks': [(0, self.rows)]}
+        if (np is None or workers < 2 or self.rows < 2
+                or self.rows * self.cols * other.cols < self.PARALLEL_THRESHOLD ** 3
+                or np.result_type(*self._integer_operands(other, lambda x, y: x * y * self.cols)) == object):
+            return serial
+        workers = min(workers, self.rows)
+        bounds = [self.rows * i // workers for i in range(workers + 1)]
+        return {'mode': 'parallel', 'workers': workers, 'blocks': list(zip(bounds[:-1], bounds[1:]))}
+
+    def matmul(self, other, workers=None):
+        """
+        Multiplies two Matrix objects, splitting the result rows into blocks computed by a process pool.
+
+        The operands and the result live in `multiprocessing.shared_memory` buffers, so no matrix is pickled.
+        Small products (see PARALLEL_THRESHOLD), object matrices and integer products that could overflow int64
+        fall back to `self * other`;
+        `matmul_plan` reports the partitioning that is used.
+
+        Parameters:
+        - other (Matrix): Right-hand operand.
+        - workers (int, optional): Number of worker processes, defaults to the number of CPUs.
+
+        Returns:
+        - Matrix: The product.
+        """
+        if self.cols != other.rows:
+            raise ValueError("Matrices must be compatible for multiplication")
+        plan = self.matmul_plan(other, workers)
+        if plan['mode'] == 'serial':
+            return self * other
+        dtype = np.result_type(self._array, other._array)
+        operands = [self._array.astype(dtype, copy=False), other._array.astype(dtype, copy=False)]
+        shapes = [operand.shape for operand in operands] + [(self.rows, other.cols)]
+        blocks = [shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+                  for shape in shapes]
+        try:
+            for block, operand in zip(blocks[:2], operands):
+                np.ndarray(operand.shape, dtype=dtype, buffer=block.buf)[...] = operand
+            specs = [(block.name, shape, dtype.str) for block, shape in zip(blocks, shapes)]
+            with ProcessPoolExecutor(max_workers=plan['workers']) as executor:
+                tasks = [executor.submit(_matmul_rows, *specs, start, stop) for start, stop in plan['blocks']]
+                for task in tasks:
+                    task.result()
+            result = np.ndarray(shapes[2], dtype=dtype, buffer=blocks[2].buf).copy()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return Matrix._from_array(result, self.rows, other.cols)
+
+    def _tiled_matmul(self, other):
+        """
+        Multiplies flat row-major storage tile by tile, so the rows of `other` used by a tile stay in cache.
+
+        Returns:
+        - result (array or list): Flat row-major storage of the product, see `_flat`.
+        """
+        n, m, p = self.rows, self.cols, other.cols
+        a, b = self._array, other._array
+        result = [0.0 if isinstance(a, array) and isinstance(b, array) else 0] * (n * p)
+        block = self.BLOCK_SIZE
+        for i0 in range(0, n, block):
+            for k0 in range(0, m, block):
+                k1 = min(k0 + block, m)
+                for j0 in range(0, p, block):
+                    j1 = min(j0 + block, p)
+                    for i in range(i0, min(i0 + block, n)):
+                        row = result[i * p + j0:i * p + j1]
+                        for k in range(k0, k1):
+                            aik = a[i * m + k]
+                            if aik:
+                                row = list(map(add, row, map(mul, repeat(aik), b[k * p + j0:k * p + j1])))
+                        result[i * p + j0:i * p + j1] = row
+        return self._flat(result)
+
+    def _factorize(self):
+        """
+        Computes (once) the LU decomposition with partial pivoting, P * A = L * U.
+
+        L (unit lower triangular) and U are packed into one square table. The result is memoized on the
+        instance and discarded whenever an element is changed.
+
+        Returns:
+        - lu (tuple): (packed LU table, row permutation, permutation sign, whether the matrix is singular).
+        """
+        if self._lu is not None:
+            return self._lu
+        if self.rows != self.cols:
+            raise ValueError("Matrix must be square")
+        n = self.rows
+        perm = list(range(n))
+        sign = 1
+        singular = False
+        if np is not None:
+            lu = self._array.astype(np.result_type(self._array.dtype, float))
+            for k in range(n):
+                p = k + int(np.argmax(np.abs(lu[k:, k])))
+                if lu[p, k] == 0:
+                    singular = True
+                    continue
+                if p != k:
+                    lu[[k, p]] = lu[[p, k]]
+                    perm[k], perm[p] = perm[p], perm[k]
+                    sign = -sign
+                lu[k + 1:, k] /= lu[k, k]
+                lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+        else:
+            # Real matrices are factorized in floating point as with NumPy; matrices holding Fractions or complex
+            # numbers keep every element's type, so Fraction matrices stay exact
+            lu = self.data
+            if all(isinstance(value, (int, float)) for row in lu for value in row):
+                lu = [[float(value) for value in row] for row in lu]
+            for k in range(n):
+                p = max(range(k, n), key=lambda i: abs(lu[i][k]))
+                if lu[p][k] == 0:
+                    singular = True
+                    continue
+                if p != k:
+                    lu[k], lu[p] = lu[p], lu[k]
+                    perm[k], perm[p] = perm[p], perm[k]
+                    sign = -sign
+                pivot_row = lu[k]
+                for i in range(k + 1, n):
+                    factor = lu[i][k] / pivot_row[k]
+                    lu[i][k] = factor
+                    if factor:
+                        lu[i][k + 1:] = [a - factor * b for a, b in zip(lu[i][k + 1:], pivot_row[k + 1:])]
+        self._lu = (lu, perm, sign, singular)
+        return self._lu
+
+    def solve(self, b):
+        """
+        Solves A * x = b using the memoized LU factorization, so repeated solves cost O(n^2) each.
+
+        Parameters:
+        - b (list, ndarray or Matrix): One right-hand side (list or 1-D ndarray of length n) or a batch of them
+          (the columns of an n x k Matrix or 2-D ndarray).
+
+        Returns:
+        - x: Solution of the same kind as `b` (list, ndarray or Matrix).
+        Raises a ValueError if the matrix is singular or `b` has the wrong number of rows.
+        """
+        lu, perm, _, singular = self._factorize()
+        if singular:
+            raise ValueError("Matrix is singular")
+        n = self.rows
+        if isinstance(b, Matrix):
+            if b.rows != n:
+                raise ValueError("Right-hand side must have as many rows as the matrix")
+            return Matrix(self._substitute(lu, perm, b.data if np is None else b._array))
+        if len(b) != n:
+            raise ValueError("Right-hand side must have as many rows as the matrix")
+        if np is not None:
+            x = self._substitute(lu, perm, np.asarray(b))
+            return x if isinstance(b, np.ndarray) else x.tolist()
+        columns = self._substitute(lu, perm, [[value] for value in b])
+        return [row[0] for row in columns]
+
+    @staticmethod
+    def _substitute(lu, perm, b):
+        """
+        Forward and back substitution against a packed LU table for one or many right-hand sides.
+        """
+        n = len(perm)
+        if np is not None:
+            x = b[perm].astype(np.result_type(lu.dtype, b.dtype))
+            for i in range(1, n):
+                x[i] -= lu[i, :i] @ x[:i]
+            for i in range(n - 1, -1, -1):
+                x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+            return x
+        x = [list(b[p]) for p in perm]
+        for i in range(n):
+            for j in range(i):
+                if lu[i][j]:
+                    x[i] = [a - lu[i][j] * c for a, c in zip(x[i], x[j])]
+        for i in range(n - 1, -1, -1):
+            for j in range(i + 1, n):
+                if lu[i][j]:
+                    x[i] = [a - lu[i][j] * c for a, c in zip(x[i], x[j])]
+            x[i] = [a / lu[i][i] for a in x[i]]
+        return x
+
+    def det(self):
+        """
+        Returns the determinant, computed from the memoized LU factorization.
+        """
+        lu, _, sign, singular = self._factorize()
+        if singular:
+            return 0.0
+        if np is not None:
+            result = sign * np.prod(np.diag(lu))
+            return result.item() if isinstance(result, np.generic) else result
+        result = sign
+        for i in range(self.rows):
+            result *= lu[i][i]
+        return result
+
+    def inverse(self):
+        """
+        Returns the inverse as a new Matrix object, solving against the identity with the memoized LU factorization.
+        The identity is built from ints, so the inverse of a Fraction matrix is exact.
+        Raises a ValueError if the matrix is singular.
+        """
+        identity = [[1 if i == j else 0 for j in range(self.rows)] for i in range(self.rows)]
+        return self.solve(Matrix(identity))
+
+    def lazy(self):
+        """
+        Returns a MatrixExpression wrapping this matrix. Operators on it build an expression tree
+        that is only computed by `evaluate()`.
+        """
+        return MatrixExpression('leaf', (self,), self.rows, self.cols)
+
+    def __str__(self):
+        """
+        Returns a string representation of the Matrix object.
+        """
+        return "\n".join(["\t".join(map(str, row)) for row in self.data])
+
+
+class MatrixExpression:
+    def __init__(self, op, operands, rows, cols):
+        """
+        Initializes a MatrixExpression node of shape `rows` x `cols`.
+
+        `op` is 'leaf' (operands: the Matrix), 'sum' (operands: (coefficient, expression) terms) or
+        'product' (operands: the expression factors, in order).
+        """
+        self.op = op
+        self.operands = operands
+        self.rows = rows
+        self.cols = cols
+
+    @staticmethod
+    def _wrap(other):
+        """
+        Turns a Matrix operand into a leaf expression.
+        """
+        return other.lazy() if isinstance(other, Matrix) else other
+
+    def _terms(self):
+        """
+        Returns the node as a tuple of (coefficient, expression) sum terms, flattening nested sums.
+        """
+        return self.operands if self.op == 'sum' else ((1, self),)
+
+    def _factors(self):
+        """
+        Returns the node as a tuple of product factors, flattening nested products.
+        """
+        return self.operands if self.op == 'product' else (self,)
+
+    def _combine(self, other, sign, word):
+        """
+        Builds the flattened sum of this expression and `sign` times `other`.
+        """
+        other = self._wrap(other)
+        if not isinstance(other, MatrixExpression):
+            return NotImplemented
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError(f"Matrices must have the same dimensions for {word}")
+        terms = self._terms() + tuple((sign * coef, term) for coef, term in other._terms())
+        return MatrixExpression('sum', terms, self.rows, self.cols)
+
+    def __add__(self, other):
+        """
+        Returns the (unevaluated) sum of two expressions or of an expression and a Matrix.
+        """
+        return self._combine(other, 1, "addition")
+
+    def __radd__(self, other):
+        """
+        Supports `matrix + expression`.
+        """
+        return self._wrap(other)._combine(self, 1, "addition") if isinstance(other, Matrix) else NotImplemented
+
+    def __sub__(self, other):
+        """
+        Returns the (unevaluated) difference of two expressions or of an expression and a Matrix.
+        """
+        return self._combine(other, -1, "subtraction")
+
+    def __rsub__(self, other):
+        """
+        Supports `matrix - expression`.
+        """
+        return self._wrap(other)._combine(self, -1, "subtraction") if isinstance(other, Matrix) else NotImplemented
+
+    def __mul__(self, other):
+        """
+        Returns the (unevaluated) product with another expression or Matrix, or the expression scaled by a number.
+        """
+        if isinstance(other, (int, float)):
+            return MatrixExpression('sum', tuple((other * coef, term) for coef, term in self._terms()),
+                                    self.rows, self.cols)
+        other = self._wrap(other)
+        if not isinstance(other, MatrixExpression):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError("Matrices must be compatible for multiplication")
+        return MatrixExpression('product', self._factors() + other._factors(), self.rows, other.cols)
+
+    def __rmul__(self, other):
+        """
+        Supports `number * expression` and `matrix * expression`.
+        """
+        if isinstance(other, (int, float)):
+            return self * other
+        return self._wrap(other) * self if isinstance(other, Matrix) else NotImplemented
+
+    def _key(self):
+        """
+        Returns a hashable key identifying the subexpression, used to evaluate repeated subexpressions once.
+        """
+        if self.op == 'leaf':
+            return ('leaf', id(self.operands[0]))
+        if self.op == 'sum':
+            return ('sum', tuple((coef, term._key()) for coef, term in self.operands))
+        return ('product', tuple(factor._key() for factor in self.operands))
+
+    def evaluate(self):
+        """
+        Computes the expression and returns a new Matrix object.
+
+        Products of several factors are multiplied in the cheapest order (matrix-chain dynamic programming),
+        sums are accumulated into a single result buffer, and repeated subexpressions are computed once.
+        """
+        result = self._evaluate({})
+        if self.op == 'leaf':
+            # Never hand back the wrapped matrix itself
+            copied = result._array.copy() if np is not None else result._array[:]
+            return Matrix._from_array(copied, result.rows, result.cols)
+        return result
+
+    def _evaluate(self, memo):
+        """
+        Evaluates the node, reusing results of identical subexpressions stored in `memo`.
+        """
+        key = self._key()
+        if key in memo:
+            return memo[key]
+        if self.op == 'leaf':
+            result = self.operands[0]
+        elif self.op == 'sum':
+            result = self._evaluate_sum(memo)
+        else:
+            result = self._evaluate_chain(memo)
+        memo[key] = result
+        return result
+
+    def _evaluate_sum(self, memo):
+        """
+        Adds all (coefficient, term) pairs into one freshly allocated buffer, without per-operator temporaries.
+        """
+        coefs = [coef for coef, _ in self.operands]
+        arrays = [term._evaluate(memo)._array for _, term in self.operands]
+        if np is not None:
+            if all(a.dtype.kind in 'iu' for a in arrays) and all(isinstance(c, int) for c in coefs):
+                # As in eager `+`: sums that could overflow int64 are computed on Python ints
+                bound = sum(abs(c) * Matrix._magnitude(a) for c, a in zip(coefs, arrays))
+                arrays = [Matrix._exact(a, bound) for a in arrays]
+            out = np.zeros((self.rows, self.cols), dtype=np.result_type(*arrays, *coefs))
+            for coef, values in zip(coefs, arrays):
+                if coef == 1:
+                    out += values
+                elif coef == -1:
+                    out -= values
+                else:
+                    out += coef * values
+            return Matrix._from_array(out, self.rows, self.cols)
+        fused = [sum(map(mul, coefs, elements)) for elements in zip(*arrays)]
+        return Matrix._from_array(Matrix._flat(fused), self.rows, self.cols)
+
+    def _evaluate_chain(self, memo):
+        """
+        Multiplies the factors in the order minimizing scalar multiplications (matrix-chain dynamic programming).
+        """
+        factors = [factor._evaluate(memo) for factor in self.operands]
+        keys = [factor._key() for factor in self.operands]
+        dims = [factors[0].rows] + [factor.cols for factor in factors]
+        n = len(factors)
+        cost = [[0] * n for _ in range(n)]
+        split = [[0] * n for _ in range(n)]
+        for length in range(2, n + 1):
+            for i in range(n - length + 1):
+                j = i + length - 1
+                cost[i][j], split[i][j] = min(
+                    (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k) for k in range(i, j))
+
+        def multiply(i, j):
+            if i == j:
+                return factors[i]
+            # Sub-chains are memoized too, so a product shared by several expressions is computed once
+            key = ('product', tuple(keys[i:j + 1]))
+            if key not in memo:
+                memo[key] = multiply(i, split[i][j]) * multiply(split[i][j] + 1, j)
+            return memo[key]
+
+        return multiply(0, n - 1)
+
+    def __str__(self):
+        """
+        Returns a string representation of the expression tree, with leaves shown as their shapes.
+        """
+        if self.op == 'leaf':
+            return f"Matrix({self.rows}x{self.cols})"
+        if self.op == 'product':
+            return "(" + " * ".join(map(str, self.operands)) + ")"
+        parts = []
+        for coef, term in self.operands:
+            sign = "-" if coef < 0 else "+"
+            scale = "" if abs(coef) == 1 else f"{abs(coef)} * "
+            parts.append(f"{sign} {scale}{term}")
+        return "(" + " ".join(parts).lstrip("+ ") + ")"
+
+if __name__ == "__main__":
+    # Example usage:
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    matrix2 = Matrix([[5, 6], [7, 8]])
+    print(matrix1 + matrix2)
@@ -0,0 +1,282 @@
+import heapq
+import numpy as np
+from .point2d import Point2D
+
+
+class _KDTree:
+    # Points per leaf; leaves are scanned with one vectorized distance computation
+    LEAF_SIZE = 32
+
+    def __init__(self, x, y, indices):
+        """
+        Builds a static, balanced KD-tree over the points with coordinates `x`, `y` and global numbers `indices`.
+
+        Nodes are numbered implicitly (children of node i are 2i + 1 and 2i + 2) and cover the index range
+        [lo, hi) of the permuted coordinate arrays, split at the middle.
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        self.indices = np.array(indices)
+        nodes = 1
+        while (len(self.x) + nodes - 1) // nodes > self.LEAF_SIZE:
+            nodes *= 2
+        self.axis = np.full(2 * nodes, -1, dtype=np.int8)
+        self.split = np.zeros(2 * nodes)
+        self._build(0, 0, len(self.x))
+
+    def _build(self, node, lo, hi):
+        if hi - lo <= self.LEAF_SIZE:
+            return
+        xs, ys = self.x[lo:hi], self.y[lo:hi]
+        axis = 0 if np.ptp(xs) >= np.ptp(ys) else 1
+        mid = (lo + hi) // 2
+        order = np.argpartition(xs if axis == 0 else ys, mid - lo)
+        self.x[lo:hi], self.y[lo:hi], self.indices[lo:hi] = xs[order], ys[order], self.indices[lo:hi][order]
+        self.axis[node] = axis
+        self.split[node] = (self.x if axis == 0 else self.y)[mid]
+        self._build(2 * node + 1, lo, mid)
+        self._build(2 * node + 2, mid, hi)
+
+    def nearest(self, px, py, k, heap, node=0, lo=0, hi=None):
+        """
+        Pushes the k nearest points onto `heap`, a max-heap of (-squared distance, index) shared across trees.
+        """
+        if hi is None:
+            hi = len(self.x)
+        axis = self.axis[node]
+        if axis < 0:
+            d2 = (self.x[lo:hi] - px) ** 2 + (self.y[lo:hi] - py) ** 2
+            worst = -heap[0][0] if len(heap) == k else np.inf
+            for i in np.flatnonzero(d2 < worst).tolist():
+                entry = (-d2[i], self.indices[lo + i])
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            return
+        mid = (lo + hi) // 2
+        diff = (px if axis == 0 else py) - self.split[node]
+        near, far = ((2 * node + 1, lo, mid), (2 * node + 2, mid, hi)) if diff < 0 else \
+            ((2 * node + 2, mid, hi), (2 * node + 1, lo, mid))
+        self.nearest(px, py, k, heap, *near)
+        if len(heap) < k or diff * diff < -heap[0][0]:
+            self.nearest(px, py, k, heap, *far)
+
+    def within_radius(self, px, py, r, found, node=0, lo=0, hi=None):
+        """
+        Appends to `found` the arrays of indices of the points within distance `r`.
+        """
+        if hi is None:
+            hi = len(self.x)
+        axis = self.axis[node]
+        if axis < 0:
+            d2 = (self.x[lo:hi] - px) ** 2 + (self.y[lo:hi] - py) ** 2
+            found.append(self.indices[lo:hi][d2 <= r * r])
+            return
+        mid = (lo + hi) // 2
+        diff = (px if axis == 0 else py) - self.split[node]
+        if diff <= r:
+            self.within_radius(px, py, r, found, 2 * node + 1, lo, mid)
+        if diff >= -r:
+            self.within_radius(px, py, r, found, 2 * node + 2, mid, hi)
+
+
+class PointCloud:
+    # Newly added points are scanned directly until this many are pending, then they get their own tree
+    BUFFER_SIZE = 256
+
+    def __init__(self, points=None, x=None, y=None):
+        """
+        Initializes a PointCloud from an iterable of Point2D objects, or from the coordinate arrays `x` and `y`.
+
+        Coordinates are stored as two contiguous float64 arrays (struct of arrays) and indexed by KD-trees.
+        """
+        if points is not None:
+            points = list(points)
+            x = [point.x for point in points]
+            y = [point.y for point in points]
+        x = np.array([] if x is None else x, dtype=float)
+        y = np.array([] if y is None else y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x and y must be 1-D arrays of the same length")
+        self._x = x
+        self._y = y
+        self._size = len(x)
+        # Static KD-trees over contiguous index ranges: (start, stop, tree)
+        self._trees = []
+        self._indexed = 0
+        self._update_index()
+
+    @property
+    def x(self):
+        """
+        Returns the x coordinates as a read-only array view.
+        """
+        view = self._x[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def y(self):
+        """
+        Returns the y coordinates as a read-only array view.
+        """
+        view = self._y[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        """
+        Returns the number of points.
+        """
+        return self._size
+
+    def __getitem__(self, i):
+        """
+        Returns point `i` as a Point2D object.
+        """
+        if not -self._size <= i < self._size:
+            raise IndexError("PointCloud index out of range")
+        return Point2D(float(self._x[i % self._size]), float(self._y[i % self._size]))
+
+    def add(self, point):
+        """
+        Adds one Point2D object to the cloud.
+        """
+        self.extend(x=[point.x], y=[point.y])
+
+    def extend(self, points=None, x=None, y=None):
+        """
+        Adds an iterable of Point2D objects, or the coordinate arrays `x` and `y`, to the cloud.
+
+        New points are indexed incrementally: they are scanned directly until BUFFER_SIZE of them are pending,
+        then indexed by a new tree, and trees of similar size are merged (logarithmic method), so no insertion
+        rebuilds the whole index.
+        """
+        if points is not None:
+            points = list(points)
+            x = [point.x for point in points]
+            y = [point.y for point in points]
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x and y must be 1-D arrays of the same length")
+        needed = self._size + len(x)
+        if needed > len(self._x):
+            capacity = max(needed, 2 * len(self._x), 16)
+            for name in ('_x', '_y'):
+                grown = np.empty(capacity)
+                grown[:self._size] = getattr(self, name)[:self._size]
+                setattr(self, name, grown)
+        self._x[self._size:needed] = x
+        self._y[self._size:needed] = y
+        self._size = needed
+        self._update_index()
+
+    def _update_index(self):
+        """
+        Indexes the pending points once there are enough of them, merging trees of similar size.
+        """
+        if self._size - self._indexed < self.BUFFER_SIZE:
+            return
+        start = self._indexed
+        while self._trees and self._trees[-1][1] - self._trees[-1][0] <= self._size - start:
+            start = self._trees.pop()[0]
+        tree = _KDTree(self._x[start:self._size], self._y[start:self._size], np.arange(start, self._size))
+        self._trees.append((start, self._size, tree))
+        self._indexed = self._size
+
+    @staticmethod
+    def _coordinates(point):
+        """
+        Returns the (x, y) coordinates of a Point2D object or of an (x, y) pair.
+        """
+        if isinstance(point, Point2D):
+            return float(point.x), float(point.y)
+        px, py = point
+        return float(px), float(py)
+
+    def nearest(self, point, k=1):
+        """
+        Finds the k points closest to `point` (a Point2D object or an (x, y) pair).
+
+        Returns:
+        - (indices, distances): Arrays of the point numbers and their distances, closest first.
+        """
+        px, py = self._coordinates(point)
+        k = min(k, self._size)
+        heap = []
+        if k > 0:
+            for _, _, tree in self._trees:
+                tree.nearest(px, py, k, heap)
+            start = self._indexed
+            d2 = (self._x[start:self._size] - px) ** 2 + (self._y[start:self._size] - py) ** 2
+            for i in np.flatnonzero(d2 < (-heap[0][0] if len(heap) == k else np.inf)).tolist():
+                entry = (-d2[i], start + i)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+        heap.sort(reverse=True)
+        indices = np.array([index for _, index in heap], dtype=np.intp)
+        distances = np.sqrt(np.array([-d2 for d2, _ in heap], dtype=float))
+        return indices, distances
+
+    def within_radius(self, point, r):
+        """
+        Finds the points within distance `r` of `point` (a Point2D object or an (x, y) pair).
+
+        Returns:
+        - indices (ndarray): Sorted numbers of the points in the circle.
+        """
+        px, py = self._coordinates(point)
+        found = [np.empty(0, dtype=np.intp)]
+        for _, _, tree in self._trees:
+            tree.within_radius(px, py, r, found)
+        start = self._indexed
+        d2 = (self._x[start:self._size] - px) ** 2 + (self._y[start:self._size] - py) ** 2
+        found.append(start + np.flatnonzero(d2 <= r * r))
+        return np.sort(np.concatenate(found))
+
+    @staticmethod
+    def _query_points(points):
+        """
+        Returns the query coordinates of a PointCloud, an (m, 2) array or an iterable of Point2D objects / pairs.
+        """
+        if isinstance(points, PointCloud):
+            return zip(points.x.tolist(), points.y.tolist())
+        if isinstance(points, np.ndarray):
+            return map(tuple, points.tolist())
+        return map(PointCloud._coordinates, points)
+
+    def nearest_many(self, points, k=1):
+        """
+        Runs `nearest` for every query point.
+
+        Returns:
+        - (indices, distances): (m, k) arrays, padded with -1 and inf when the cloud has fewer than k points.
+        """
+        results = [self.nearest(point, k) for point in self._query_points(points)]
+        indices = np.full((len(results), k), -1, dtype=np.intp)
+        distances = np.full((len(results), k), np.inf)
+        for row, (found, dist) in enumerate(results):
+            indices[row, :len(found)] = found
+            distances[row, :len(dist)] = dist
+        return indices, distances
+
+    def within_radius_many(self, points, r):
+        """
+        Runs `within_radius` for every query point and returns the list of index arrays.
+        """
+        return [self.within_radius(point, r) for point in self._query_points(points)]
+
+    def __str__(self):
+        """
+        Returns a string representation of the PointCloud object.
+        """
+        return f"PointCloud({self._size} points)"
+
+if __name__ == "__main__":
+    # Example usage:
+    cloud = PointCloud([Point2D(0, 0), Point2D(1, 1), Point2D(4, 6)])
+    print(cloud.nearest(Point2D(1, 2), k=2))  # Output: (array([1, 0]), array([1.        , 2.23606798]))
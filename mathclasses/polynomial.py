@@ -0,0 +1,430 @@
+from fractions import Fraction
+from itertools import zip_longest
+from numbers import Rational
+
+from . import fraction
+
+try:
+    import numpy as np
+except ImportError:  # FFT multiplication and array evaluation need NumPy
+    np = None
+
+
+class Polynomial:
+    # Multiplication switches from schoolbook to Karatsuba at this many coefficients,
+    # and from Karatsuba to FFT (when NumPy is available) at FFT_THRESHOLD
+    KARATSUBA_THRESHOLD = 32
+    FFT_THRESHOLD = 512
+
+    def __init__(self, coefficients):
+        """
+        Initializes a Polynomial object with coefficients provided in a list.
+        Coefficients are ordered from highest degree to lowest degree.
+        """
+        self.coefficients = coefficients
+
+    def __add__(self, other):
+        """
+        Adds two Polynomial objects and returns a new Polynomial object with the result.
+        """
+        # Pair coefficients from the lowest degree up, treating missing ones as 0
+        coeffs = [a + b for a, b in zip_longest(reversed(self.coefficients), reversed(other.coefficients), fillvalue=0)]
+        coeffs.reverse()
+        return Polynomial(coeffs)
+
+    def __sub__(self, other):
+        """
+        Subtracts two Polynomial objects and returns a new Polynomial object with the result.
+        """
+        # Pair coefficients from the lowest degree up, treating missing ones as 0
+        coeffs = [a - b for a, b in zip_longest(reversed(self.coefficients), reversed(other.coefficients), fillvalue=0)]
+        coeffs.reverse()
+        return Polynomial(coeffs)
+
+    def __mul__(self, other):
+        """
+        Multiplies two Polynomial objects and returns a new Polynomial object with the result.
+        Uses schoolbook multiplication for short polynomials, Karatsuba (or a single big-integer product for
+        integer coefficients) for medium ones and the FFT for long ones. Multiplying by a number scales every
+        coefficient.
+        """
+        if isinstance(other, (int, float, complex)):
+            return Polynomial([coeff * other for coeff in self.coefficients])
+        return Polynomial(self._mul_coeffs(self.coefficients, other.coefficients))
+
+    def __rmul__(self, other):
+        """
+        Scales every coefficient when the polynomial is multiplied from the left by a number.
+        """
+        if isinstance(other, (int, float, complex)):
+            return self * other
+        return NotImplemented
+
+    @staticmethod
+    def _mul_coeffs(a, b):
+        """
+        Multiplies two coefficient lists, picking schoolbook, Karatsuba, Kronecker substitution (large integers)
+        or FFT multiplication by length and coefficient type.
+
+        Convolution does not depend on the coefficient order, so this works on highest-first and lowest-first lists.
+        """
+        if not a or not b:
+            return []
+        shorter = min(len(a), len(b))
+        if shorter >= Polynomial.FFT_THRESHOLD and np is not None:
+            coeffs = Polynomial._fft_mul(a, b)
+            if coeffs is not None:
+                return coeffs
+        if shorter >= Polynomial.KARATSUBA_THRESHOLD and all(type(c) is int for c in a) \
+                and all(type(c) is int for c in b):
+            # Exact integers the FFT cannot represent: one big-integer product is faster than Karatsuba
+            return Polynomial._kronecker_mul(a, b)
+        if shorter >= Polynomial.KARATSUBA_THRESHOLD:
+            return Polynomial._karatsuba(a, b)
+        return Polynomial._schoolbook(a, b)
+
+    @staticmethod
+    def _schoolbook(a, b):
+        """
+        Multiplies two coefficient lists term by term in O(len(a) * len(b)).
+        """
+        result = [0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    result[i + j] += x * y
+        return result
+
+    @staticmethod
+    def _karatsuba(a, b):
+        """
+        Multiplies two coefficient lists with Karatsuba's algorithm in O(n^1.585).
+
+        The split is done on the lowest-degree halves, so the lists are padded on the left (highest degree)
+        to a common length and the padding is stripped from the product.
+        """
+        n = max(len(a), len(b))
+        if min(len(a), len(b)) < Polynomial.KARATSUBA_THRESHOLD:
+            return Polynomial._schoolbook(a, b)
+        pad_a, pad_b = n - len(a), n - len(b)
+        a = [0] * pad_a + a if pad_a else a
+        b = [0] * pad_b + b if pad_b else b
+        half = n // 2
+        # x = high * X^half + low, with `high` holding the n - half highest-degree coefficients
+        a_high, a_low = a[:n - half], a[n - half:]
+        b_high, b_low = b[:n - half], b[n - half:]
+        z2 = Polynomial._karatsuba(a_high, b_high)
+        z0 = Polynomial._karatsuba(a_low, b_low)
+        a_sum = (Polynomial(a_high) + Polynomial(a_low)).coefficients
+        b_sum = (Polynomial(b_high) + Polynomial(b_low)).coefficients
+        z1 = Polynomial._karatsuba(a_sum, b_sum)
+        # z1 - z0 - z2, aligned on the lowest degree
+        middle = (Polynomial(z1) - Polynomial(z0) - Polynomial(z2)).coefficients
+        result = [0] * (2 * n - 1)
+        for offset, part in ((2 * half, z2), (half, middle), (0, z0)):
+            end = len(result) - offset
+            for i, coeff in enumerate(reversed(part)):
+                if coeff:
+                    result[end - 1 - i] += coeff
+        return result[pad_a + pad_b:]
+
+    @staticmethod
+    def _kronecker_mul(a, b):
+        """
+        Multiplies two integer coefficient lists exactly with one big-integer product (Kronecker substitution).
+
+        Each list is packed into an integer with a fixed number of bytes per coefficient, wide enough for any
+        product coefficient, so the big-integer multiplication does all the work in C.
+        """
+        bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+        width = (bound.bit_length() + 2 + 7) // 8
+        half = 1 << (8 * width - 1)
+
+        def pack(coeffs):
+            # Pack positive and negative parts separately so every packed digit is non-negative
+            positive = b''.join(max(c, 0).to_bytes(width, 'little') for c in coeffs)
+            negative = b''.join(max(-c, 0).to_bytes(width, 'little') for c in coeffs)
+            return int.from_bytes(positive, 'little') - int.from_bytes(negative, 'little')
+
+        # Read from the lowest degree up, as the little-endian digits
+        size = len(a) + len(b) - 1
+        product = pack(a[::-1]) * pack(b[::-1])
+        # Offset every digit by `half` so that the signed coefficients become non-negative digits
+        offset = int.from_bytes(half.to_bytes(width, 'little') * size, 'little')
+        digits = (product + offset).to_bytes(width * size, 'little')
+        return [int.from_bytes(digits[i:i + width], 'little') - half for i in range(width * (size - 1), -1, -width)]
+
+    @staticmethod
+    def _fft_mul(a, b):
+        """
+        Multiplies two real coefficient lists with the FFT in O(n log n).
+
+        Integer products are rounded back to exact integers when the round-off of the transform is guaranteed
+        to stay below 1/2. Returns None when the FFT cannot be used exactly (other coefficient types, or integer
+        products too large), so the caller falls back to Kronecker substitution or Karatsuba.
+        """
+        if not all(isinstance(coeff, (int, float)) for coeff in a) or \
+                not all(isinstance(coeff, (int, float)) for coeff in b):
+            return None
+        size = len(a) + len(b) - 1
+        fft_size = 1 << (size - 1).bit_length()
+        integral = all(isinstance(coeff, int) for coeff in a) and all(isinstance(coeff, int) for coeff in b)
+        # The round-off grows with log2(fft_size) on top of the 53-bit mantissa, so the largest possible product
+        # coefficient must leave that many bits (and a margin of 2) free
+        if integral and max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b)) \
+                >= 2 ** (52 - fft_size.bit_length() - 2):
+            return None
+        product = np.fft.irfft(np.fft.rfft(a, fft_size) * np.fft.rfft(b, fft_size), fft_size)[:size]
+        if integral:
+            return np.rint(product).astype(np.int64).tolist()
+        return product.tolist()
+
+    def __call__(self, x):
+        """
+        Evaluates the polynomial at `x` using Horner's rule.
+
+        `x` can be a number or a NumPy array of points; an array is evaluated in one vectorized pass
+        per coefficient, updating a single result array in place. Integer values that could overflow int64
+        are evaluated on Python ints (an object array), so they stay exact as in scalar calls.
+        """
+        if np is not None and isinstance(x, np.ndarray):
+            if not self.coefficients:
+                return np.zeros(x.shape)
+            coefficients = [self._rational(coeff) for coeff in self.coefficients]
+            try:
+                dtype = np.result_type(x, *coefficients)
+            except (TypeError, OverflowError):
+                # Fraction, Decimal and other Python number objects, or ints beyond int64: Horner's rule on an
+                # object array
+                dtype = np.dtype(object)
+            if dtype.kind in 'iu' and x.size:
+                # Every partial Horner result is at most max|coeff| * (degree + 1) * max(1, max|x|)^degree
+                largest = max(1, int(x.max()), -int(x.min()))
+                bits = (max(abs(int(coeff)) for coeff in coefficients).bit_length()
+                        + len(coefficients).bit_length() + (len(coefficients) - 1) * largest.bit_length())
+                if bits >= 63:
+                    dtype = np.dtype(object)
+            result = np.full(x.shape, coefficients[0], dtype=dtype)
+            for coeff in coefficients[1:]:
+                result *= x
+                result += coeff
+            return result
+        result = 0
+        for coeff in self.coefficients:
+            result = result * x + coeff
+        return result
+
+    @staticmethod
+    def _strip(coeffs):
+        """
+        Returns the coefficient list without leading (highest-degree) zeros.
+        """
+        start = 0
+        while start < len(coeffs) and coeffs[start] == 0:
+            start += 1
+        return coeffs[start:]
+
+    @staticmethod
+    def _divide(a, b):
+        """
+        Divides coefficient `a` by the leading coefficient `b`, keeping integers exact when `b` is 1.
+        """
+        return a if b == 1 else a / b
+
+    @staticmethod
+    def _inverse_series(f, k, one=1):
+        """
+        Returns g with f * g = 1 mod x^k, for a lowest-first coefficient list `f` with f[0] != 0 (Newton iteration).
+        `one` is the unit of the coefficient type (e.g. Fraction(1)), so exact types stay exact.
+        """
+        g = [Polynomial._divide(one, f[0])]
+        precision = 1
+        while precision < k:
+            precision = min(2 * precision, k)
+            error = [-coeff for coeff in Polynomial._mul_coeffs(f[:precision], g)[:precision]]
+            error[0] += 2
+            g = Polynomial._mul_coeffs(g, error)[:precision]
+        return g
+
+    def __divmod__(self, other):
+        """
+        Divides two Polynomial objects and returns the (quotient, remainder) pair of Polynomial objects.
+
+        Long division is used for short quotients; long ones use a Newton-iteration inverse of the reversed
+        divisor, so the cost is that of a few multiplications. Raises a ZeroDivisionError for a zero divisor.
+        """
+        a = self._strip(self.coefficients)
+        b = self._strip(other.coefficients)
+        if not b:
+            raise ZeroDivisionError("Polynomial division by zero")
+        if len(a) < len(b):
+            return Polynomial([0]), Polynomial(a or [0])
+        quotient_length = len(a) - len(b) + 1
+        if min(quotient_length, len(b)) < self.KARATSUBA_THRESHOLD:
+            remainder = list(a)
+            quotient = []
+            for i in range(quotient_length):
+                coeff = self._divide(remainder[i], b[0])
+                quotient.append(coeff)
+                if coeff:
+                    for j in range(1, len(b)):
+                        remainder[i + j] -= coeff * b[j]
+            remainder = remainder[quotient_length:]
+        else:
+            # Read highest-first as lowest-first, the lists are the reversed polynomials:
+            # rev(q) = rev(a) * rev(b)^-1 mod x^(quotient length), and rev(q) read back is q
+            inverse = self._inverse_series(b, quotient_length, a[0] ** 0)
+            quotient = self._mul_coeffs(a[:quotient_length], inverse)[:quotient_length]
+            product = self._mul_coeffs(b, quotient)
+            remainder = [x - y for x, y in zip(a[quotient_length:], product[quotient_length:])]
+        return Polynomial(quotient), Polynomial(remainder or [0])
+
+    def __floordiv__(self, other):
+        """
+        Returns the quotient of the polynomial division as a new Polynomial object.
+        """
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        """
+        Returns the remainder of the polynomial division as a new Polynomial object.
+        """
+        return divmod(self, other)[1]
+
+    def derivative(self):
+        """
+        Returns the derivative as a new Polynomial object.
+        """
+        degree = len(self.coefficients) - 1
+        return Polynomial([coeff * (degree - i) for i, coeff in enumerate(self.coefficients[:-1])] or [0])
+
+    def compose(self, other):
+        """
+        Returns the composition self(other(x)) as a new Polynomial object, using Horner's rule on polynomials.
+        """
+        result = Polynomial(self.coefficients[:1])
+        for coeff in self.coefficients[1:]:
+            result = result * other + Polynomial([coeff])
+        return result
+
+    def roots(self):
+        """
+        Returns the roots as a NumPy array, computed as the eigenvalues of the companion matrix.
+        The array is real when every root is real, complex otherwise.
+        """
+        coeffs = self._strip([self._rational(coeff) for coeff in self.coefficients])
+        # Trailing zero coefficients are roots at 0
+        zeros = 0
+        while coeffs and coeffs[-1] == 0:
+            coeffs = coeffs[:-1]
+            zeros += 1
+        degree = len(coeffs) - 1
+        if degree < 1:
+            return np.zeros(zeros)
+        companion = np.diag(np.ones(degree - 1), -1)
+        companion[0, :] = -np.asarray(coeffs[1:], dtype=complex if any(isinstance(c, complex) for c in coeffs)
+                                      else float) / coeffs[0]
+        roots = np.concatenate([np.linalg.eigvals(companion), np.zeros(zeros)])
+        return roots.real if np.all(roots.imag == 0) else roots
+
+    @staticmethod
+    def _rational(value):
+        """
+        Returns a mathclasses Fraction as the equivalent `fractions.Fraction`, the exact type this module computes
+        with; other values are returned unchanged.
+        """
+        if isinstance(value, fraction.Fraction):
+            return Fraction(value.n, value.d)
+        return value
+
+    @staticmethod
+    def _is_exact(values):
+        """
+        Returns True when every value is an integer or a fraction, so evaluation and interpolation can be exact.
+        """
+        return all(isinstance(value, (Rational, fraction.Fraction)) for value in values)
+
+    def multipoint_evaluate(self, points):
+        """
+        Evaluates the polynomial at many points.
+
+        With integer or Fraction coefficients and points each point is evaluated exactly with Horner's rule, O(n)
+        big-number operations per point; mathclasses Fractions are converted to `fractions.Fraction`. (A subproduct
+        tree needs fewer multiplications, but its remainders have much larger numbers, so it is slower for exact
+        values at every size benchmarked.) Other values are evaluated with the vectorized Horner's rule of `__call__`
+        (when NumPy is available).
+
+        Returns:
+        - values (list): Value of the polynomial at each point.
+        """
+        points = [self._rational(point) for point in points]
+        if np is not None and not (self._is_exact(self.coefficients) and self._is_exact(points)):
+            return self(np.asarray(points)).tolist()
+        poly = Polynomial([self._rational(coeff) for coeff in self.coefficients])
+        return [poly(point) for point in points]
+
+    @staticmethod
+    def interpolate(xs, ys):
+        """
+        Returns the Polynomial of lowest degree through the points (xs[i], ys[i]).
+
+        Uses Newton's divided differences, O(n^2) arithmetic operations. Integer or Fraction values are interpolated
+        exactly and give `fractions.Fraction` coefficients (mathclasses Fractions are converted); their numbers grow
+        with n, so the cost grows faster than n^2 in practice. Floating point values are vectorized with NumPy when
+        it is available.
+        Raises a ValueError if the x values are not distinct.
+        """
+        xs = [Polynomial._rational(x) for x in xs]
+        ys = [Polynomial._rational(y) for y in ys]
+        if len(xs) != len(ys) or not xs:
+            raise ValueError("xs and ys must be non-empty and have the same length")
+        if len(set(xs)) != len(xs):
+            raise ValueError("Interpolation points must be distinct")
+        if np is not None and not (Polynomial._is_exact(xs) and Polynomial._is_exact(ys)):
+            return Polynomial._interpolate_newton(np.asarray(xs), np.asarray(ys))
+        coef = [Fraction(y) for y in ys]
+        n = len(xs)
+        for j in range(1, n):
+            for i in range(n - 1, j - 1, -1):
+                coef[i] = (coef[i] - coef[i - 1]) / (xs[i] - xs[i - j])
+        result = [coef[-1]]
+        for k in range(n - 2, -1, -1):
+            # result * (x - xs[k]) + coef[k], highest degree first
+            result = [a - xs[k] * b for a, b in zip(result + [0], [0] + result)]
+            result[-1] += coef[k]
+        return Polynomial(Polynomial._strip(result) or [0])
+
+    @staticmethod
+    def _interpolate_newton(xs, ys):
+        """
+        Interpolates floating point values with Newton's divided differences, then expands the Newton form.
+        """
+        coef = ys.astype(np.result_type(xs, ys, float))
+        n = len(xs)
+        for j in range(1, n):
+            coef[j:] = (coef[j:] - coef[j - 1:-1]) / (xs[j:] - xs[:n - j])
+        result = coef[-1:]
+        for k in range(n - 2, -1, -1):
+            # result * (x - xs[k]) + coef[k], highest degree first
+            result = np.append(result, 0) - xs[k] * np.insert(result, 0, 0)
+            result[-1] += coef[k]
+        return Polynomial(result.tolist())
+
+    def __str__(self):
+        """
+        Returns a string representation of the Polynomial object in a human-readable format.
+        """
+        terms = []
+        # Iterate through coefficients in reverse order (from highest degree to lowest)
+        for power, coeff in enumerate(reversed(self.coefficients)):
+            if coeff:
+                # Format each term based on its power
+                terms.append(f"{coeff}x^{power}" if power else f"{coeff}")
+        # Join terms with "+" and return the polynomial as a string
+        return " + ".join(reversed(terms))
+
+if __name__ == "__main__":
+    # Example usage:
+    p1 = Polynomial([1, 2, 3])  # Represents x^2 + 2x + 3
+    p2 = Polynomial([3, 4])     # Represents 3x + 4
+    print(p1 + p2)  # Output: x^2 + 5x + 7
@@ -0,0 +1,854 @@
+import copy
+import json
+import math
+import os
+import random
+import bisect
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import numpy as np
+
+class MonteCarloResult:
+    def __init__(self, n, mean, m2, confidence=0.95, converged=False):
+        """
+        Initializes a MonteCarloResult from the running statistics of `n` evaluations.
+
+        Parameters:
+        - n (int): Number of evaluations so far.
+        - mean (float): Running mean of the evaluations.
+        - m2 (float): Running sum of squared deviations from the mean.
+        - confidence (float): Confidence level of the interval.
+        - converged (bool): Whether the target standard error has been reached.
+        """
+        self.n = n
+        self.mean = mean
+        self.variance = m2 / (n - 1) if n > 1 else 0.0
+        self.std_error = math.sqrt(self.variance / n) if n else float('inf')
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.confidence = confidence
+        self.ci = (mean - z * self.std_error, mean + z * self.std_error)
+        self.converged = converged
+
+    def __str__(self):
+        """
+        Returns a string representation of the MonteCarloResult object.
+        """
+        return (f"MonteCarloResult(mean={self.mean}, variance={self.variance}, std_error={self.std_error}, "
+                f"ci={self.ci}, n={self.n})")
+
+
+def _monte_carlo_chunk(sampler, f, seed_seq, size, vectorized):
+    """
+    Evaluates `f` on `size` draws from `sampler` with its own random stream.
+
+    Returns:
+    - partial (tuple): (count, mean, sum of squared deviations) of the evaluations.
+    """
+    draws = sampler.sample_many(size, np.random.default_rng(seed_seq))
+    if vectorized:
+        values = np.asarray(f(draws), dtype=float)
+    else:
+        values = np.fromiter((f(x) for x in draws), dtype=float, count=size)
+    mean = values.mean()
+    return size, float(mean), float(((values - mean) ** 2).sum())
+
+
+def _combine_partials(a, b):
+    """
+    Merges two (count, mean, sum of squared deviations) partials (Chan et al. parallel update).
+    """
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+class ProbabilityDistribution:
+    # LRU cache of discretized tables built by the factory methods, keyed on (family, parameters, num_points)
+    _table_cache = OrderedDict()
+    _table_cache_size = 128
+    # Support size above which sampler='auto' switches from the CDF search to the alias table
+    ALIAS_THRESHOLD = 10000
+
+    def __init__(self, probabilities=None, pdf=None, support=None, num_points=1000, sampler='auto'):
+        """
+        Initializes a ProbabilityDistribution object.
+
+        Parameters:
+        - probabilities (dict): Dictionary of probabilities for discrete distributions.
+        - pdf (function): Probability density function for continuous distributions.
+        - support (tuple): Tuple defining the range of the support for continuous distributions.
+        - num_points (int): Number of points used to discretize the pdf of continuous distributions.
+        - sampler (str): 'cdf' for binary search over the CDF, 'alias' for O(1) draws from a Walker/Vose
+          alias table, or 'auto' to use the alias table when the support has more than ALIAS_THRESHOLD values.
+        """
+        if sampler not in ('auto', 'cdf', 'alias'):
+            raise ValueError("sampler must be 'auto', 'cdf' or 'alias'")
+        self.is_continuous = pdf is not None
+        if self.is_continuous:
+            self.pdf = pdf
+            self.support = support
+            self.probabilities = self._discretize_pdf(pdf, support, num_points)
+        else:
+            self.probabilities = probabilities
+        self.cdf = self._create_cdf()
+        self._build_sampling_arrays()
+        if sampler == 'auto':
+            sampler = 'alias' if len(self.cdf) > self.ALIAS_THRESHOLD else 'cdf'
+        self.sampler = sampler
+        if sampler == 'alias':
+            self._build_alias_table()
+
+    def _discretize_pdf(self, pdf, support, num_points=1000):
+        """
+        Discretizes a continuous probability density function (pdf) over a given support range.
+
+        The pdf is evaluated once over the whole `np.linspace` grid; pdfs that only accept scalars
+        are evaluated point by point as a fallback.
+
+        Parameters:
+        - pdf (function): Probability density function.
+        - support (tuple): Tuple defining the range of the support.
+        - num_points (int): Number of points to discretize the pdf.
+
+        Returns:
+        - probabilities (dict): Discretized probabilities as a dictionary.
+        """
+        start, end = support
+        xs, step = np.linspace(start, end, num_points, endpoint=False, retstep=True)
+        try:
+            densities = np.asarray(pdf(xs), dtype=float)
+        except (TypeError, ValueError):
+            densities = None
+        if densities is None or densities.shape != xs.shape:
+            densities = np.fromiter((pdf(x) for x in xs.tolist()), dtype=float, count=num_points)
+        return dict(zip(xs.tolist(), (densities * step).tolist()))
+
+    def _create_cdf(self):
+        """
+        Creates the cumulative distribution function (CDF) from probabilities.
+
+        Returns:
+        - cdf (list): List of tuples (cumulative probability, value).
+        """
+        items = list(self.probabilities)
+        probs = np.fromiter(self.probabilities.values(), dtype=float, count=len(items))
+        total = probs.sum()
+        if total != 1:
+            probs = probs / total  # Normalize probabilities
+        self._cdf_array = np.cumsum(probs)
+        return list(zip(self._cdf_array.tolist(), items))
+
+    def _build_sampling_arrays(self):
+        """
+        Stores the support as a NumPy array next to `_cdf_array` so that many values can be drawn in a single call.
+
+        Numeric supports are kept as a float/int ndarray, categorical supports as an object ndarray.
+        """
+        items = [item for _, item in self.cdf]
+        if all(isinstance(item, (int, float)) for item in items):
+            self._values_array = np.asarray(items)
+        else:
+            self._values_array = np.empty(len(items), dtype=object)
+            self._values_array[:] = items
+
+    def _build_alias_table(self):
+        """
+        Builds the Walker/Vose alias table used for O(1) sampling.
+
+        Each slot i keeps the probability `_alias_prob[i]` of returning value i and otherwise returns
+        value `_alias_index[i]`.
+        """
+        probs = np.fromiter(self.probabilities.values(), dtype=float, count=len(self.probabilities))
+        n = len(probs)
+        scaled = (probs * (n / probs.sum())).tolist()
+        alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left over only differs from 1 by rounding error
+        for i in small + large:
+            scaled[i] = 1.0
+        self._alias_prob = np.asarray(scaled)
+        self._alias_index = np.asarray(alias, dtype=np.intp)
+
+    def sample(self, n=None, rng=None):
+        """
+        Samples from the probability distribution using the CDF.
+
+        Parameters:
+        - n (int, optional): Number of values to draw. If omitted a single value is returned.
+        - rng (numpy.random.Generator or int, optional): Generator (or seed) used for the draws.
+
+        Returns:
+        - value (float or int): Sampled value from the distribution, or an ndarray of `n` values.
+        """
+        if n is not None:
+            return self.sample_many(n, rng)
+        if self.sampler == 'alias':
+            if rng is None:
+                r, u = random.random(), random.random()
+            else:
+                r, u = np.random.default_rng(rng).random(2).tolist()
+            i = min(int(r * len(self._alias_prob)), len(self._alias_prob) - 1)
+            if u >= self._alias_prob[i]:
+                i = self._alias_index[i]
+            return self._values_array[i]
+        r = random.random() if rng is None else np.random.default_rng(rng).random()
+        if 'cdf' not in self.__dict__:
+            # Loaded tables: search the mapped array instead of materializing the tuple list
+            idx = int(np.searchsorted(self._cdf_array, r, side='left'))
+            return self._values_array[min(idx, len(self._cdf_array) - 1)]
+        idx = bisect.bisect(self.cdf, (r,))
+        return self.cdf[min(idx, len(self.cdf) - 1)][1]
+
+    def sample_many(self, n, rng=None):
+        """
+        Draws `n` values at once with a single vectorized search over the CDF, or a single
+        vectorized alias table lookup when the alias sampler is used.
+
+        Parameters:
+        - n (int): Number of values to draw.
+        - rng (numpy.random.Generator or int, optional): Generator (or seed) used for the draws,
+          so that runs can be reproduced.
+
+        Returns:
+        - values (ndarray): Numeric ndarray for numeric supports, object ndarray for categorical ones.
+        """
+        rng = np.random.default_rng(rng)
+        if self.sampler == 'alias':
+            idx = rng.integers(0, len(self._alias_prob), size=n)
+            idx = np.where(rng.random(n) < self._alias_prob[idx], idx, self._alias_index[idx])
+            return self._values_array[idx]
+        idx = np.searchsorted(self._cdf_array, rng.random(n), side='left')
+        # Guard against the last cumulative value being slightly below 1 due to rounding
+        np.minimum(idx, len(self._cdf_array) - 1, out=idx)
+        return self._values_array[idx]
+
+    def expected_value(self):
+        """
+        Computes the expected value of the distribution.
+
+        Returns:
+        - ev (float or int): Expected value.
+        """
+        if all(isinstance(item, (int, float)) for item in self.probabilities):
+            return sum(item * prob for item, prob in self.probabilities.items())
+        else:
+            raise ValueError("Expected value is not defined for categorical distributions")
+
+    def variance(self):
+        """
+        Computes the variance of the distribution.
+
+        Returns:
+        - var (float): Variance.
+        """
+        if all(isinstance(item, (int, float)) for item in self.probabilities):
+            mean = self.expected_value()
+            return sum(prob * (item - mean) ** 2 for item, prob in self.probabilities.items())
+        else:
+            raise ValueError("Variance is not defined for categorical distributions")
+
+    def std_dev(self):
+        """
+        Computes the standard deviation of the distribution.
+
+        Returns:
+        - std (float): Standard deviation.
+        """
+        return self.variance() ** 0.5
+
+    def moment(self, k):
+        """
+        Computes the k-th moment of the distribution.
+
+        Parameters:
+        - k (int): Order of the moment.
+
+        Returns:
+        - moment (float or int): k-th moment.
+        """
+        if all(isinstance(item, (int, float)) for item in self.probabilities):
+            return sum(prob * (item ** k) for item, prob in self.probabilities.items())
+        else:
+            raise ValueError("Moments are not defined for categorical distributions")
+
+    def _sampling_state(self):
+        """
+        Returns a lightweight, picklable copy holding only what `sample_many` needs, to ship to worker processes.
+        """
+        state = ProbabilityDistribution.__new__(ProbabilityDistribution)
+        for name in ('sampler', '_cdf_array', '_values_array', '_alias_prob', '_alias_index'):
+            if hasattr(self, name):
+                setattr(state, name, getattr(self, name))
+        return state
+
+    def monte_carlo_stream(self, f, n, workers=1, seed=None, chunk_size=100000, vectorized=True, confidence=0.95,
+                           target_se=None):
+        """
+        Estimates E[f(X)] by Monte Carlo, yielding a MonteCarloResult after every chunk of draws.
+
+        The `n` draws are split into chunks of `chunk_size`; chunk i always uses the i-th child of
+        `numpy.random.SeedSequence(seed)` and the partials are merged in chunk order, so for a given
+        seed the results do not depend on `workers`.
+
+        Parameters:
+        - f (function): Function of the draws. With `vectorized=True` it receives an ndarray of draws and
+          returns an ndarray of values; otherwise it is called once per draw. Must be picklable when workers > 1.
+        - n (int): Maximum number of draws.
+        - workers (int): Number of worker processes. 1 evaluates in the current process.
+        - seed (int or SeedSequence, optional): Seed for reproducible results.
+        - chunk_size (int): Number of draws per chunk.
+        - vectorized (bool): Whether `f` accepts a whole ndarray of draws.
+        - confidence (float): Confidence level of the reported interval.
+        - target_se (float, optional): Stop as soon as the standard error drops to this value.
+
+        Yields:
+        - result (MonteCarloResult): Running estimate after each chunk.
+        """
+        if n <= 0 or chunk_size <= 0:
+            raise ValueError("n and chunk_size must be positive")
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        num_chunks = -(-n // chunk_size)
+        seeds = root.spawn(num_chunks)
+        sizes = [chunk_size] * (num_chunks - 1) + [n - chunk_size * (num_chunks - 1)]
+        sampler = self._sampling_state()
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            if executor is None:
+                partials = (_monte_carlo_chunk(sampler, f, seeds[i], sizes[i], vectorized) for i in range(num_chunks))
+            else:
+                partials = self._pooled_partials(executor, workers, sampler, f, seeds, sizes, vectorized)
+            total = None
+            for partial in partials:
+                total = partial if total is None else _combine_partials(total, partial)
+                result = MonteCarloResult(*total, confidence=confidence)
+                if target_se is not None and total[0] > 1 and result.std_error <= target_se:
+                    result.converged = True
+                    yield result
+                    return
+                yield result
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _pooled_partials(executor, workers, sampler, f, seeds, sizes, vectorized):
+        """
+        Yields chunk partials in chunk order while keeping a bounded number of chunks in flight.
+        """
+        pending = deque()
+        next_chunk = 0
+        while next_chunk < len(sizes) or pending:
+            while next_chunk < len(sizes) and len(pending) < 2 * workers:
+                pending.append(executor.submit(_monte_carlo_chunk, sampler, f, seeds[next_chunk],
+                                               sizes[next_chunk], vectorized))
+                next_chunk += 1
+            yield pending.popleft().result()
+
+    def monte_carlo(self, f, n, workers=1, seed=None, chunk_size=100000, vectorized=True, confidence=0.95,
+                    target_se=None):
+        """
+        Estimates E[f(X)] by Monte Carlo, optionally across a process pool and with early stopping.
+
+        Takes the same parameters as `monte_carlo_stream` and returns its last result.
+
+        Returns:
+        - result (MonteCarloResult): Mean, variance, standard error and confidence interval of the estimate.
+        """
+        result = None
+        for result in self.monte_carlo_stream(f, n, workers, seed, chunk_size, vectorized, confidence, target_se):
+            pass
+        return result
+
+    # Below this many lattice points on the shorter side, direct convolution beats FFT convolution
+    FFT_THRESHOLD = 64
+    # Largest distance (in lattice steps) between a value and its lattice point for a support to count as a lattice
+    LATTICE_TOLERANCE = 1e-9
+
+    @classmethod
+    def _on_lattice(cls, positions):
+        """
+        Returns True when every position (a value or a step ratio measured in lattice steps) is a whole number,
+        up to LATTICE_TOLERANCE.
+        """
+        return bool(np.all(np.abs(positions - np.rint(positions)) <= cls.LATTICE_TOLERANCE))
+
+    def _lattice(self):
+        """
+        Returns the numeric support sorted, with its probabilities and the natural lattice step.
+
+        Integer supports use the gcd of their gaps as the step. Other supports must be evenly spaced multiples
+        of one step (such as a `linspace` grid); the step is derived from the span and the smallest gap, so the
+        rounding of individual gaps does not shift it.
+
+        Returns:
+        - lattice (tuple): (sorted values, probabilities, step); step is 0 for a single-point support and None
+          when the values are not on a lattice.
+        """
+        if self._values_array.dtype == object:
+            raise ValueError("Convolution is not defined for categorical distributions")
+        order = np.argsort(self._values_array, kind='stable')
+        values = self._values_array[order]
+        probs = np.diff(self._cdf_array, prepend=0.0)[order]
+        gaps = np.diff(values)
+        gaps = gaps[gaps > 0]
+        if len(gaps) == 0:
+            step = 0
+        elif values.dtype.kind in 'iu':
+            step = int(np.gcd.reduce(gaps))
+        else:
+            span = float(values[-1] - values[0])
+            step = span / round(span / float(gaps.min()))
+            if not self._on_lattice((values - values[0]) / step):
+                step = None
+        return values, probs, step
+
+    @staticmethod
+    def _regrid(values, probs, step):
+        """
+        Accumulates `probs` onto the lattice `values[0] + i * step`. The values are known to lie on it, up to
+        round-off, so each one goes to its nearest point.
+        """
+        if step == 0:
+            return np.array([probs.sum()])
+        positions = np.rint((values - values[0]) / step).astype(np.intp)
+        grid = np.zeros(positions[-1] + 1)
+        np.add.at(grid, positions, probs)
+        return grid
+
+    @staticmethod
+    def _convolve_pairs(values_a, probs_a, values_b, probs_b):
+        """
+        Computes the distribution of the sum from all len(a) * len(b) pairs of values, merging equal sums.
+        """
+        sums, inverse = np.unique(np.add.outer(values_a, values_b).ravel(), return_inverse=True)
+        probs = np.bincount(inverse.ravel(), weights=np.multiply.outer(probs_a, probs_b).ravel())
+        keep = probs > 0
+        return ProbabilityDistribution(dict(zip(sums[keep].tolist(), probs[keep].tolist())))
+
+    def convolve(self, other):
+        """
+        Computes the distribution of X + Y for independent X ~ self and Y ~ other.
+
+        When both numeric supports lie on a common lattice (integer supports, evenly spaced grids whose steps
+        are whole multiples of each other), the probability arrays are convolved on it with the FFT (or directly
+        when one of them is short). Other supports are summed exactly over all pairs of values, which costs
+        O(len(self) * len(other)).
+
+        Parameters:
+        - other (ProbabilityDistribution): Distribution of the independent summand.
+
+        Returns:
+        - ProbabilityDistribution: Discrete distribution of the sum.
+        """
+        values_a, probs_a, step_a = self._lattice()
+        values_b, probs_b, step_b = other._lattice()
+        if step_a is None or step_b is None:
+            return self._convolve_pairs(values_a, probs_a, values_b, probs_b)
+        steps = [step for step in (step_a, step_b) if step]
+        if not steps:
+            step = 0
+        elif all(isinstance(step, int) for step in steps):
+            step = math.gcd(*steps)
+        else:
+            step = min(steps)
+            if not self._on_lattice(np.array(steps) / step):
+                return self._convolve_pairs(values_a, probs_a, values_b, probs_b)
+        grid_a = self._regrid(values_a, probs_a, step)
+        grid_b = self._regrid(values_b, probs_b, step)
+        if min(len(grid_a), len(grid_b)) < self.FFT_THRESHOLD:
+            probs = np.convolve(grid_a, grid_b)
+        else:
+            size = len(grid_a) + len(grid_b) - 1
+            fft_size = 1 << (size - 1).bit_length()
+            probs = np.fft.irfft(np.fft.rfft(grid_a, fft_size) * np.fft.rfft(grid_b, fft_size), fft_size)[:size]
+            # Remove the round-off noise the FFT leaves around zero
+            probs[probs < 1e-15 * probs.max()] = 0.0
+        nonzero = np.flatnonzero(probs)
+        probs = probs[nonzero[0]:nonzero[-1] + 1]
+        values = (values_a[0] + values_b[0]) + step * np.arange(nonzero[0], nonzero[-1] + 1)
+        return ProbabilityDistribution(dict(zip(values.tolist(), probs.tolist())))
+
+    def __add__(self, other):
+        """
+        Returns the distribution of the sum of two independent random variables (see `convolve`).
+        """
+        return self.convolve(other)
+
+    def __radd__(self, other):
+        """
+        Supports `sum()` over distributions, which starts from 0.
+        """
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def self_convolve(self, k):
+        """
+        Computes the distribution of X1 + ... + Xk for k independent copies of this distribution,
+        using repeated squaring (O(log k) convolutions).
+
+        Parameters:
+        - k (int): Number of summands (k >= 1).
+
+        Returns:
+        - ProbabilityDistribution: Distribution of the k-fold sum.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        result = None
+        power = self
+        while True:
+            if k & 1:
+                result = power if result is None else result.convolve(power)
+            k >>= 1
+            if not k:
+                return result
+            power = power.convolve(power)
+
+    # Array files written by `save`, mapped back by `load`
+    _TABLE_FILES = ('cdf', 'values', 'alias_prob', 'alias_index')
+    # Categorical label types the JSON side table stores; tuples of them are written as JSON lists
+    _JSON_LABEL_TYPES = (str, int, float, bool, type(None))
+
+    @staticmethod
+    def _check_label(label):
+        """
+        Raises a TypeError if `label` cannot be written to the JSON side table and read back unchanged.
+        """
+        if isinstance(label, tuple):
+            for item in label:
+                ProbabilityDistribution._check_label(item)
+        elif not isinstance(label, ProbabilityDistribution._JSON_LABEL_TYPES):
+            raise TypeError(f"Cannot save categorical label {label!r} of type {type(label).__name__}: labels must be "
+                            "str, int, float, bool, None or tuples of them")
+
+    @staticmethod
+    def _label_from_json(value):
+        """
+        Restores a label read from the JSON side table. Labels are hashable, so every JSON list was a tuple.
+        """
+        if isinstance(value, list):
+            return tuple(ProbabilityDistribution._label_from_json(item) for item in value)
+        return value
+
+    def save(self, path):
+        """
+        Saves the distribution tables to the directory `path`.
+
+        The CDF, the numeric values and the alias table (if any) are written as `.npy` arrays next to a small
+        JSON header. Categorical labels are written to a JSON side table; they must be str, int, float, bool,
+        None or tuples of them, and are checked before anything is written (TypeError otherwise).
+        The pdf of a continuous distribution is not saved. Each file is replaced atomically, so saving over the
+        directory a distribution was loaded from is safe.
+
+        Parameters:
+        - path (str): Directory to write (created if missing).
+        """
+        categorical = self._values_array.dtype == object
+        if categorical:
+            labels = self._values_array.tolist()
+            for label in labels:
+                self._check_label(label)
+        os.makedirs(path, exist_ok=True)
+        header = {
+            'format': 'ProbabilityDistribution',
+            'version': 1,
+            'size': len(self._cdf_array),
+            'categorical': bool(categorical),
+            'sampler': self.sampler,
+            'is_continuous': self.is_continuous,
+            'support': list(self.support) if self.is_continuous else None,
+        }
+        arrays = {'cdf': self._cdf_array}
+        if categorical:
+            self._write_atomic(path, 'labels.json', 'w', lambda f: json.dump(labels, f))
+        else:
+            arrays['values'] = self._values_array
+        if self.sampler == 'alias':
+            arrays['alias_prob'] = self._alias_prob
+            arrays['alias_index'] = self._alias_index
+        for name, array in arrays.items():
+            self._write_atomic(path, name + '.npy', 'wb', lambda f: np.save(f, np.ascontiguousarray(array)))
+        self._write_atomic(path, 'header.json', 'w', lambda f: json.dump(header, f))
+
+    @staticmethod
+    def _write_atomic(path, name, mode, write):
+        """
+        Writes the file `name` in the directory `path` by calling write(f) on a temporary file in that directory,
+        then moving it into place. A failed write leaves the previous file intact, and a distribution loaded with
+        mmap=True from the same directory keeps reading the old file.
+        """
+        fd, temp = tempfile.mkstemp(prefix='.' + name + '.', suffix='.tmp', dir=path)
+        try:
+            with os.fdopen(fd, mode) as f:
+                write(f)
+            os.replace(temp, os.path.join(path, name))
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Loads a distribution written by `save`.
+
+        With `mmap=True` the arrays are memory-mapped read-only, so processes loading the same tables share
+        one copy of them and can sample right away. The `probabilities` dict and the `cdf` tuple list are only
+        built if they are accessed.
+
+        Parameters:
+        - path (str): Directory written by `save`.
+        - mmap (bool): Whether to memory-map the arrays instead of reading them into memory.
+
+        Returns:
+        - ProbabilityDistribution: Distribution backed by the loaded tables.
+        """
+        with open(os.path.join(path, 'header.json')) as f:
+            header = json.load(f)
+        if header.get('format') != 'ProbabilityDistribution' or header.get('version') != 1:
+            raise ValueError(f"{path} does not contain a saved ProbabilityDistribution")
+        dist = ProbabilityDistribution.__new__(ProbabilityDistribution)
+        dist.is_continuous = header['is_continuous']
+        if dist.is_continuous:
+            dist.support = tuple(header['support'])
+        dist.sampler = header['sampler']
+        arrays = {}
+        for name in ProbabilityDistribution._TABLE_FILES:
+            file = os.path.join(path, name + '.npy')
+            if os.path.exists(file):
+                arrays[name] = np.load(file, mmap_mode='r' if mmap else None)
+        dist._cdf_array = arrays['cdf']
+        if header['categorical']:
+            with open(os.path.join(path, 'labels.json')) as f:
+                labels = [ProbabilityDistribution._label_from_json(label) for label in json.load(f)]
+            dist._values_array = np.empty(len(labels), dtype=object)
+            dist._values_array[:] = labels
+        else:
+            dist._values_array = arrays['values']
+        if dist.sampler == 'alias':
+            dist._alias_prob = arrays['alias_prob']
+            dist._alias_index = arrays['alias_index']
+        return dist
+
+    def __getattr__(self, name):
+        """
+        Builds the `probabilities` dict and the `cdf` tuple list of a loaded distribution on first access.
+        """
+        if name not in ('probabilities', 'cdf'):
+            raise AttributeError(name)
+        values = self._values_array.tolist()
+        cdf = self._cdf_array.tolist()
+        self.probabilities = dict(zip(values, np.diff(self._cdf_array, prepend=0.0).tolist()))
+        self.cdf = list(zip(cdf, values))
+        return getattr(self, name)
+
+    def plot(self):
+        """
+        Plots the probability distribution.
+
+        This method uses matplotlib to visualize either a bar chart for discrete distributions
+        or a line plot for continuous distributions.
+        """
+        import matplotlib.pyplot as plt  # Loaded on first plot, not at import time
+
+        items, probs = zip(*self.probabilities.items())
+        plt.bar(items, probs, width=0.1 if self.is_continuous else 0.5)
+        plt.xlabel('Value')
+        plt.ylabel('Probability')
+        plt.title('Probability Distribution')
+        plt.show()
+
+    def __str__(self):
+        """
+        Returns a string representation of the ProbabilityDistribution object.
+        """
+        return f"ProbabilityDistribution({self.probabilities})"
+
+    @staticmethod
+    def from_continuous(pdf, support, num_points=1000):
+        """
+        Creates a ProbabilityDistribution object from a continuous probability density function.
+
+        Parameters:
+        - pdf (function): Probability density function.
+        - support (tuple): Tuple defining the range of the support.
+        - num_points (int): Number of points to discretize the pdf.
+
+        Returns:
+        - ProbabilityDistribution: Instance of ProbabilityDistribution for the given continuous distribution.
+        """
+        return ProbabilityDistribution(pdf=pdf, support=support, num_points=num_points)
+
+    @staticmethod
+    def _cached(key, build):
+        """
+        Returns a distribution for `key` from the LRU table cache, calling `build()` on a miss.
+
+        The NumPy tables of a cached distribution are made read-only and shared between the returned instances;
+        each instance gets its own `probabilities` dict and `cdf` list, so changing one instance never changes
+        the cache or later results (see `_share`).
+
+        Parameters:
+        - key (tuple): (family, parameters..., num_points) identifying the discretized table.
+        - build (function): Zero-argument function creating the ProbabilityDistribution on a miss.
+
+        Returns:
+        - ProbabilityDistribution: Instance backed by the cached tables.
+        """
+        cache = ProbabilityDistribution._table_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return ProbabilityDistribution._share(cache[key])
+        dist = build()
+        if ProbabilityDistribution._table_cache_size > 0:
+            for name in ('_cdf_array', '_values_array', '_alias_prob', '_alias_index'):
+                table = dist.__dict__.get(name)
+                if table is not None:
+                    table.flags.writeable = False
+            cache[key] = dist
+            ProbabilityDistribution._evict()
+            return ProbabilityDistribution._share(dist)
+        return dist
+
+    @staticmethod
+    def _share(dist):
+        """
+        Returns a shallow copy of a cached distribution with its own copies of the mutable `probabilities`
+        dict and `cdf` list; the read-only NumPy tables stay shared.
+        """
+        shared = copy.copy(dist)
+        shared.probabilities = dict(dist.probabilities)
+        shared.cdf = list(dist.cdf)
+        return shared
+
+    @staticmethod
+    def _evict():
+        """
+        Drops the least recently used tables until the cache fits in its configured size.
+        """
+        cache = ProbabilityDistribution._table_cache
+        while len(cache) > ProbabilityDistribution._table_cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def set_cache_size(size):
+        """
+        Sets the maximum number of discretized tables kept by the factory methods.
+
+        Parameters:
+        - size (int): Maximum number of cached tables. 0 disables caching.
+        """
+        if size < 0:
+            raise ValueError("Cache size cannot be negative")
+        ProbabilityDistribution._table_cache_size = size
+        ProbabilityDistribution._evict()
+
+    @staticmethod
+    def clear_cache():
+        """
+        Removes every discretized table from the cache.
+        """
+        ProbabilityDistribution._table_cache.clear()
+
+    @staticmethod
+    def normal(mean=0, std_dev=1, num_points=1000):
+        """
+        Creates a ProbabilityDistribution object for a normal distribution.
+
+        Parameters:
+        - mean (float): Mean of the normal distribution.
+        - std_dev (float): Standard deviation of the normal distribution.
+        - num_points (int): Number of points to discretize the pdf.
+
+        Returns:
+        - ProbabilityDistribution: Instance of ProbabilityDistribution for the normal distribution.
+        """
+        def build():
+            from scipy.stats import norm  # Loaded only when a table has to be built, not on cache hits
+            pdf = lambda x: norm.pdf(x, mean, std_dev)
+            return ProbabilityDistribution.from_continuous(pdf, support, num_points)
+        support = (mean - 4*std_dev, mean + 4*std_dev)
+        return ProbabilityDistribution._cached(('normal', mean, std_dev, num_points), build)
+
+    @staticmethod
+    def uniform(start=0, end=1, num_points=1000):
+        """
+        Creates a ProbabilityDistribution object for a uniform distribution.
+
+        Parameters:
+        - start (float): Start of the uniform distribution range.
+        - end (float): End of the uniform distribution range.
+        - num_points (int): Number of points to discretize the pdf.
+
+        Returns:
+        - ProbabilityDistribution: Instance of ProbabilityDistribution for the uniform distribution.
+        """
+        def build():
+            from scipy.stats import uniform
+            pdf = lambda x: uniform.pdf(x, start, end - start)
+            return ProbabilityDistribution.from_continuous(pdf, support, num_points)
+        support = (start, end)
+        return ProbabilityDistribution._cached(('uniform', start, end, num_points), build)
+
+    @staticmethod
+    def binomial(n, p):
+        """
+        Creates a ProbabilityDistribution object for a binomial distribution.
+
+        Parameters:
+        - n (int): Number of trials.
+        - p (float): Probability of success in each trial.
+
+        Returns:
+        - ProbabilityDistribution: Instance of ProbabilityDistribution for the binomial distribution.
+        """
+        def build():
+            from scipy.stats import binom
+            ks = np.arange(n + 1)
+            return ProbabilityDistribution(dict(zip(ks.tolist(), binom.pmf(ks, n, p).tolist())))
+        return ProbabilityDistribution._cached(('binomial', n, p, n + 1), build)
+
+# Example usage for discrete distribution
+'''discrete_dist = ProbabilityDistribution({"A": 0.5, "B": 0.3, "C": 0.2})
+print(discrete_dist)
+print("Sample:", discrete_dist.sample())
+
+try:
+    print("Expected Value:", discrete_dist.expected_value())
+except ValueError as e:
+    print(e)
+
+try:
+    print("Variance:", discrete_dist.variance())
+except ValueError as e:
+    print(e)
+
+discrete_dist.plot()'''
+
+# Example usage for continuous distribution (Normal distribution)
+'''continuous_dist = ProbabilityDistribution.normal(mean=0, std_dev=1)
+print(continuous_dist)
+print("Sample:", continuous_dist.sample())
+continuous_dist.plot()'''
+
+# Example usage for continuous distribution (Uniform distribution)
+'''uniform_dist = ProbabilityDistribution.uniform(start=0, end=10)
+print(uniform_dist)
+print("Sample:", uniform_dist.sample())
+uniform_dist.plot()'''
+
+# Example usage for discrete distribution (Binomial distribution)
+'''binom_dist = ProbabilityDistribution.binomial(n=10, p=0.5)
+print(binom_dist)
+print("Sample:", binom_dist.sample())
+binom_dist.plot()'''
@@ -0,0 +1,314 @@
+"""
+Opt-in instrumentation for the mathclasses package.
+
+    with mathclasses.profile() as p:
+        ...
+    p.print_stats()
+
+While a profile is active, the methods listed in TARGETS are replaced on their classes by wrappers that
+record call counts, wall time, net memory blocks allocated and operand sizes. Leaving the block puts the
+original functions back, so when no profile is active the classes are exactly as defined and there is no
+overhead at all. Only one profile can be active at a time. Calls made in worker processes (parallel
+`Matrix.matmul`, `ProbabilityDistribution.monte_carlo` with workers > 1) are not recorded.
+"""
+import functools
+import importlib
+import json
+import marshal
+import sys
+import threading
+import time
+
+# Module -> {class name -> methods to instrument}
+TARGETS = {
+    'fraction': {
+        'Fraction': ['__init__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+                     '__truediv__', '__rtruediv__', 'simplify', 'sum', 'prod', 'det', 'solve'],
+    },
+    'complex_number': {
+        'ComplexNumber': ['__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+                          '__truediv__', '__rtruediv__'],
+    },
+    'complex_array': {
+        'ComplexArray': ['__init__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+                         '__truediv__', '__rtruediv__', '__abs__', 'conjugate', 'exp', 'fft', 'ifft'],
+    },
+    'polynomial': {
+        'Polynomial': ['__init__', '__add__', '__sub__', '__mul__', '__rmul__', '__call__', '__divmod__',
+                       'derivative', 'compose', 'roots', 'multipoint_evaluate', 'interpolate'],
+    },
+    'matrix': {
+        'Matrix': ['__init__', '__add__', '__sub__', '__mul__', '__rmul__', 'matmul', '_factorize', 'solve',
+                   'det', 'inverse'],
+        'MatrixExpression': ['evaluate'],
+    },
+    'sparse_matrix': {
+        'SparseMatrix': ['__init__', '__add__', '__sub__', '__mul__', '__rmul__', 'transpose', 'to_matrix',
+                         'from_matrix'],
+    },
+    'vector': {
+        'Vector': ['__add__', '__sub__', 'dot'],
+    },
+    'vector_array': {
+        'VectorArray': ['__init__', '__add__', '__sub__', '__iadd__', '__isub__', '__mul__', '__imul__', 'dot',
+                        'norms', 'normalize'],
+    },
+    'point2d': {
+        'Point2D': ['distance_to'],
+    },
+    'point_cloud': {
+        'PointCloud': ['__init__', 'extend', 'nearest', 'within_radius', 'nearest_many', 'within_radius_many'],
+    },
+    'quaternion': {
+        'Quaternion': ['__add__', '__sub__', '__mul__', 'conjugate', 'norm', 'inverse'],
+    },
+    'quaternion_array': {
+        'QuaternionArray': ['__init__', '__add__', '__sub__', '__mul__', '__rmul__', 'conjugate', 'normalize',
+                            'inverse', 'rotate', 'slerp', 'rotation_matrices', 'from_rotation_matrices'],
+    },
+    'probability_distribution': {
+        'ProbabilityDistribution': ['__init__', '_create_cdf', '_build_alias_table', 'sample', 'sample_many',
+                                    'expected_value', 'variance', 'monte_carlo', 'convolve', 'self_convolve',
+                                    'save', 'load', 'normal', 'uniform', 'binomial'],
+    },
+}
+
+# Different operand sizes kept per operation; further ones are counted under "other"
+MAX_SIZES = 32
+
+_active = None
+
+
+def _describe(value):
+    """
+    Returns a short size description of an operand (matrix dimensions, polynomial degree, support size,
+    length, bit length), or None when size does not apply.
+    """
+    name = type(value).__name__
+    try:
+        if name in ('Matrix', 'MatrixExpression'):
+            return f'{value.rows}x{value.cols}'
+        if name == 'SparseMatrix':
+            return f'{value.rows}x{value.cols} nnz={value.nnz}'
+        if name == 'Polynomial':
+            return f'deg={len(value.coefficients) - 1}'
+        if name == 'Fraction':
+            return f'bits={max(value.n.bit_length(), value.d.bit_length())}'
+        if name == 'ProbabilityDistribution':
+            cdf = value.__dict__.get('_cdf_array')
+            return None if cdf is None else f'support={len(cdf)}'
+        if isinstance(value, (str, bytes, dict)):
+            return None
+        return f'len={len(value)}'
+    except (AttributeError, TypeError):  # Not sized, or `self` of an __init__ that has not run yet
+        return None
+
+
+class _Stat:
+    __slots__ = ('calls', 'cumtime', 'tottime', 'blocks', 'sizes', 'depth', 'code')
+
+    def __init__(self, code):
+        self.calls = 0
+        self.cumtime = 0.0
+        self.tottime = 0.0
+        self.blocks = 0
+        self.sizes = {}
+        self.depth = 0  # Active activations, so recursive calls are not counted twice in cumtime
+        self.code = code
+
+
+class Profile:
+    def __init__(self, targets=None):
+        """
+        Initializes a Profile recording the operations of the classes named in `targets` (all of TARGETS
+        by default). Use it as a context manager, usually through `mathclasses.profile()`.
+        """
+        self.targets = targets
+        self.stats = {}
+        self._originals = []
+        self._local = threading.local()
+        self.wall_time = 0.0
+
+    def _selected(self):
+        """
+        Yields (class, method name) for every method to instrument, importing the modules that define them.
+        Modules whose optional dependencies are missing are skipped.
+        """
+        for module_name, classes in TARGETS.items():
+            selected = [name for name in classes if self.targets is None or name in self.targets]
+            if not selected:
+                continue
+            try:
+                module = importlib.import_module(f'.{module_name}', __package__)
+            except ImportError:  # e.g. the NumPy-only classes when NumPy is not installed
+                continue
+            for class_name in selected:
+                cls = getattr(module, class_name)
+                for method in classes[class_name]:
+                    yield cls, method
+
+    def _wrap(self, key, func):
+        """
+        Returns a wrapper of `func` that records one call of the operation `key` per invocation.
+        """
+        stat = self.stats.setdefault(key, _Stat(func.__code__))
+        local = self._local
+        perf_counter = time.perf_counter
+        allocated_blocks = sys.getallocatedblocks
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = getattr(local, 'stack', None)
+            if stack is None:
+                stack = local.stack = []
+            size = ', '.join(filter(None, map(_describe, args[:2])))
+            stack.append(0.0)
+            stat.depth += 1
+            blocks = allocated_blocks()
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stat.blocks += allocated_blocks() - blocks
+                stat.depth -= 1
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                stat.calls += 1
+                stat.tottime += elapsed - children
+                if not stat.depth:
+                    stat.cumtime += elapsed
+                if size:
+                    sizes = stat.sizes
+                    if size in sizes or len(sizes) < MAX_SIZES:
+                        sizes[size] = sizes.get(size, 0) + 1
+                    else:
+                        sizes['other'] = sizes.get('other', 0) + 1
+        return wrapper
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another profile is already active")
+        _active = self
+        try:
+            for cls, method in self._selected():
+                raw = cls.__dict__.get(method)
+                if raw is None:
+                    continue
+                key = f'{cls.__name__}.{method}'
+                if isinstance(raw, staticmethod):
+                    replacement = staticmethod(self._wrap(key, raw.__func__))
+                elif isinstance(raw, classmethod):
+                    replacement = classmethod(self._wrap(key, raw.__func__))
+                else:
+                    replacement = self._wrap(key, raw)
+                self._originals.append((cls, method, raw))
+                setattr(cls, method, replacement)
+        except BaseException:
+            self._restore()
+            raise
+        self._start = time.perf_counter()
+        return self
+
+    def _restore(self):
+        """
+        Puts the original methods back on their classes.
+        """
+        global _active
+        for cls, method, raw in reversed(self._originals):
+            setattr(cls, method, raw)
+        self._originals.clear()
+        _active = None
+
+    def __exit__(self, *exc_info):
+        self.wall_time += time.perf_counter() - self._start
+        self._restore()
+        return False
+
+    def _rows(self, sort='cumtime'):
+        """
+        Returns (operation, stat) pairs for the operations that were called, most expensive first.
+        """
+        rows = [(key, stat) for key, stat in self.stats.items() if stat.calls]
+        if sort == 'name':
+            return sorted(rows)
+        return sorted(rows, key=lambda row: getattr(row[1], sort), reverse=True)
+
+    def to_dict(self):
+        """
+        Returns the recorded statistics as a JSON-serializable dict.
+        """
+        return {
+            'wall_time': self.wall_time,
+            'operations': {
+                key: {
+                    'calls': stat.calls,
+                    'cumtime': stat.cumtime,
+                    'tottime': stat.tottime,
+                    'blocks': stat.blocks,
+                    'sizes': dict(sorted(stat.sizes.items(), key=lambda item: -item[1])),
+                }
+                for key, stat in self._rows()
+            },
+        }
+
+    def to_json(self, path=None, indent=2):
+        """
+        Returns the statistics as a JSON string, and also writes it to `path` if given.
+        """
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def print_stats(self, sort='cumtime', limit=None, file=None):
+        """
+        Prints a pstats-style table: calls, total time spent in the operation itself (tottime), time
+        including instrumented operations it called (cumtime), net memory blocks allocated and the most
+        common operand size.
+
+        Parameters:
+        - sort (str): 'cumtime', 'tottime', 'calls', 'blocks' or 'name'.
+        - limit (int, optional): Print only this many rows.
+        """
+        file = sys.stdout if file is None else file
+        rows = self._rows(sort)[:limit]
+        print(f"{'ncalls':>9} {'tottime':>9} {'percall':>9} {'cumtime':>9} {'percall':>9} {'blocks':>9}  "
+              f"{'operation':<40} most common size", file=file)
+        for key, stat in rows:
+            size = max(stat.sizes.items(), key=lambda item: item[1])[0] if stat.sizes else ''
+            print(f"{stat.calls:>9} {stat.tottime:>9.4f} {stat.tottime / stat.calls:>9.2e} {stat.cumtime:>9.4f} "
+                  f"{stat.cumtime / stat.calls:>9.2e} {stat.blocks:>9}  {key:<40} {size}", file=file)
+
+    def dump_stats(self, path):
+        """
+        Writes the statistics in the binary format of `cProfile`, so they can be loaded with
+        `pstats.Stats(path)` or opened in tools that read profiler output.
+        """
+        stats = {}
+        for key, stat in self.stats.items():
+            if stat.calls:
+                code = stat.code
+                stats[(code.co_filename, code.co_firstlineno, key)] = (stat.calls, stat.calls, stat.tottime,
+                                                                      stat.cumtime, {})
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+
+
+def profile(targets=None):
+    """
+    Returns a Profile context manager that instruments the mathclasses operations while it is active.
+
+    Parameters:
+    - targets (iterable of str, optional): Class names to instrument, e.g. ['Matrix', 'Fraction'].
+      All classes in TARGETS by default.
+
+    Example:
+        with mathclasses.profile() as p:
+            Matrix([[1, 2], [3, 4]]).solve([1, 2])
+        p.print_stats()
+    """
+    return Profile(None if targets is None else set(targets))
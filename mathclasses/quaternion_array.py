@@ -0,0 +1,286 @@
+import numpy as np
+from .matrix import Matrix
+from .quaternion import Quaternion
+
+
+class QuaternionArray:
+    # Below this angle between two rotations SLERP falls back to normalized linear interpolation
+    SLERP_EPSILON = 1e-6
+
+    def __init__(self, quaternions=None, array=None):
+        """
+        Initializes a QuaternionArray from an iterable of Quaternion objects, or from an (n, 4) array of
+        (w, x, y, z) rows.
+
+        The components are stored in one contiguous (n, 4) float64 array, so every operation below is a
+        handful of NumPy calls instead of one Python call per quaternion.
+        """
+        if quaternions is not None:
+            array = [(q.w, q.x, q.y, q.z) for q in quaternions]
+        array = np.array([] if array is None else array, dtype=float).reshape(-1, 4)
+        self._array = np.ascontiguousarray(array)
+
+    @classmethod
+    def _from_array(cls, values):
+        """
+        Wraps an already computed (n, 4) array in a new QuaternionArray object without copying it.
+        """
+        quaternions = cls.__new__(cls)
+        quaternions._array = values
+        return quaternions
+
+    @staticmethod
+    def _components(other):
+        """
+        Returns the (n, 4) or (4,) array of a QuaternionArray or Quaternion operand, or None for anything else.
+        """
+        if isinstance(other, QuaternionArray):
+            return other._array
+        if isinstance(other, Quaternion):
+            return np.array([other.w, other.x, other.y, other.z], dtype=float)
+        return None
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Returns the (n, 4) array of (w, x, y, z) rows, sharing this storage unless NumPy asks for a copy
+        (`copy=True`, as `np.array(quaternions)` does) or another dtype is requested.
+        """
+        if dtype is not None and np.dtype(dtype) != self._array.dtype:
+            if copy is False:
+                raise ValueError("Converting a QuaternionArray to another dtype requires a copy")
+            return self._array.astype(dtype)
+        return self._array.copy() if copy else self._array
+
+    def __len__(self):
+        """
+        Returns the number of quaternions.
+        """
+        return len(self._array)
+
+    def __getitem__(self, i):
+        """
+        Returns quaternion `i` as a Quaternion object.
+        """
+        return Quaternion(*self._array[i].tolist())
+
+    def __iter__(self):
+        """
+        Iterates over the quaternions as Quaternion objects.
+        """
+        return (Quaternion(*row) for row in self._array.tolist())
+
+    def __add__(self, other):
+        """
+        Adds a QuaternionArray (elementwise) or a Quaternion (to every quaternion) and returns a new QuaternionArray.
+        """
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return QuaternionArray._from_array(self._array + components)
+
+    def __sub__(self, other):
+        """
+        Subtracts a QuaternionArray (elementwise) or a Quaternion (from every quaternion) and returns a new
+        QuaternionArray.
+        """
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return QuaternionArray._from_array(self._array - components)
+
+    @staticmethod
+    def _hamilton(a, b):
+        """
+        Computes the Hamilton products of the broadcastable (..., 4) arrays `a` and `b`.
+        """
+        aw, ax, ay, az = np.moveaxis(a, -1, 0)
+        bw, bx, by, bz = np.moveaxis(b, -1, 0)
+        return np.stack([aw * bw - ax * bx - ay * by - az * bz,
+                         aw * bx + ax * bw + ay * bz - az * by,
+                         aw * by - ax * bz + ay * bw + az * bx,
+                         aw * bz + ax * by - ay * bx + az * bw], axis=-1)
+
+    def __mul__(self, other):
+        """
+        Multiplies by a number, or takes the Hamilton product with a QuaternionArray of the same length
+        (elementwise) or with a single Quaternion (self[i] * other for every i).
+        """
+        if isinstance(other, (int, float)):
+            return QuaternionArray._from_array(self._array * other)
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        if components.ndim == 2 and len(components) != len(self._array):
+            raise ValueError("QuaternionArrays must have the same length")
+        return QuaternionArray._from_array(self._hamilton(self._array, components))
+
+    def __rmul__(self, other):
+        """
+        Multiplies a number, or a single Quaternion on the left (other * self[i] for every i).
+        """
+        if isinstance(other, (int, float)):
+            return QuaternionArray._from_array(self._array * other)
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return QuaternionArray._from_array(self._hamilton(components, self._array))
+
+    def conjugate(self):
+        """
+        Returns the conjugates (w, -x, -y, -z) as a new QuaternionArray.
+        """
+        return QuaternionArray._from_array(self._array * np.array([1.0, -1.0, -1.0, -1.0]))
+
+    def norms(self):
+        """
+        Returns the Euclidean norm of every quaternion as an ndarray.
+        """
+        return np.sqrt(np.einsum('ij,ij->i', self._array, self._array))
+
+    def normalize(self):
+        """
+        Returns a new QuaternionArray of unit quaternions. Raises a ZeroDivisionError for zero quaternions.
+        """
+        norms = self.norms()
+        if not norms.all():
+            raise ZeroDivisionError("Cannot normalize a zero quaternion")
+        return QuaternionArray._from_array(self._array / norms[:, None])
+
+    def inverse(self):
+        """
+        Returns the multiplicative inverses (conjugates divided by squared norms) as a new QuaternionArray.
+        Raises a ZeroDivisionError for zero quaternions.
+        """
+        n2 = np.einsum('ij,ij->i', self._array, self._array)
+        if not n2.all():
+            raise ZeroDivisionError("The zero quaternion has no inverse")
+        return QuaternionArray._from_array(self.conjugate()._array / n2[:, None])
+
+    def rotate(self, points):
+        """
+        Rotates 3D points by the quaternions, which must be unit quaternions (see `normalize`).
+
+        Either the array holds one quaternion, which rotates every point, or one quaternion per point.
+        Uses v' = v + 2w (u x v) + 2u x (u x v) with u = (x, y, z), which equals q v q* without
+        forming the intermediate quaternion products.
+
+        Parameters:
+        - points: (n, 3) array (or nested list) of points, or a single (3,) point.
+
+        Returns:
+        - rotated (ndarray): The rotated points, with the same shape as `points` (or (n, 3) when one point is
+          rotated by n quaternions).
+        """
+        points = np.asarray(points, dtype=float)
+        if points.shape[-1] != 3:
+            raise ValueError("Points must have 3 coordinates")
+        q = self._array
+        if len(q) != 1 and points.ndim == 2 and len(points) != len(q):
+            raise ValueError("Need one quaternion, or one quaternion per point")
+        w = q[:, :1] if len(q) != 1 else q[0, :1]
+        u = q[:, 1:] if len(q) != 1 else q[0, 1:]
+        t = 2.0 * np.cross(u, points)
+        return points + w * t + np.cross(u, t)
+
+    def dot(self, other):
+        """
+        Returns the 4D dot product of every quaternion with the matching quaternion of `other` as an ndarray.
+        """
+        return np.einsum('ij,ij->i', self._array, np.broadcast_to(self._components(other), self._array.shape))
+
+    def slerp(self, other, t):
+        """
+        Spherical linear interpolation from these unit quaternions to the ones in `other` (a QuaternionArray of
+        the same length, or one Quaternion).
+
+        Always follows the shorter arc (q and -q are the same rotation) and falls back to normalized linear
+        interpolation when the two rotations are closer than SLERP_EPSILON.
+
+        Parameters:
+        - t: Interpolation parameter, a number or one value per quaternion (0 gives self, 1 gives other).
+
+        Returns:
+        - QuaternionArray: The interpolated unit quaternions.
+        """
+        end = np.broadcast_to(self._components(other), self._array.shape)
+        t = np.broadcast_to(np.asarray(t, dtype=float), (len(self._array),))[:, None]
+        cos = np.einsum('ij,ij->i', self._array, end)[:, None]
+        end = np.where(cos < 0, -end, end)
+        cos = np.minimum(np.abs(cos), 1.0)
+        angle = np.arccos(cos)
+        sin = np.sin(angle)
+        close = sin < self.SLERP_EPSILON
+        safe = np.where(close, 1.0, sin)
+        start_weight = np.where(close, 1.0 - t, np.sin((1.0 - t) * angle) / safe)
+        end_weight = np.where(close, t, np.sin(t * angle) / safe)
+        result = start_weight * self._array + end_weight * end
+        return QuaternionArray._from_array(result / np.linalg.norm(result, axis=1, keepdims=True))
+
+    def rotation_matrices(self):
+        """
+        Returns the 3x3 rotation matrix of every unit quaternion as an (n, 3, 3) ndarray.
+        """
+        w, x, y, z = self._array.T
+        return np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y),
+                         2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x),
+                         2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)],
+                        axis=-1).reshape(-1, 3, 3)
+
+    def to_matrices(self):
+        """
+        Returns the rotation matrices as a list of 3x3 Matrix objects.
+        """
+        return [Matrix._from_array(np.ascontiguousarray(m), 3, 3) for m in self.rotation_matrices()]
+
+    @staticmethod
+    def from_rotation_matrices(matrices):
+        """
+        Creates a QuaternionArray of unit quaternions from rotation matrices.
+
+        Parameters:
+        - matrices: A 3x3 Matrix object, an iterable of them, or a (3, 3) / (n, 3, 3) array.
+
+        Uses Shepperd's method: each matrix is converted through its largest of w, x, y, z, which keeps the
+        result accurate for every rotation angle. The sign is chosen so that w >= 0.
+        """
+        if isinstance(matrices, Matrix):
+            matrices = [matrices]
+        if not isinstance(matrices, np.ndarray):
+            matrices = [np.asarray(m._array, dtype=float).reshape(m.rows, m.cols) if isinstance(m, Matrix) else m
+                        for m in matrices]
+        m = np.asarray(matrices, dtype=float).reshape(-1, 3, 3)
+        if m.shape[1:] != (3, 3):
+            raise ValueError("Rotation matrices must be 3x3")
+        trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+        # 4 * w^2, 4 * x^2, 4 * y^2, 4 * z^2 from the diagonal; the largest is the best-conditioned pivot
+        squares = np.stack([1 + trace,
+                            1 + 2 * m[:, 0, 0] - trace,
+                            1 + 2 * m[:, 1, 1] - trace,
+                            1 + 2 * m[:, 2, 2] - trace], axis=-1)
+        pivot = np.argmax(squares, axis=1)
+        # Off-diagonal sums and differences: 4wx, 4wy, 4wz, 4xy, 4xz, 4yz
+        wx = m[:, 2, 1] - m[:, 1, 2]
+        wy = m[:, 0, 2] - m[:, 2, 0]
+        wz = m[:, 1, 0] - m[:, 0, 1]
+        xy = m[:, 0, 1] + m[:, 1, 0]
+        xz = m[:, 0, 2] + m[:, 2, 0]
+        yz = m[:, 1, 2] + m[:, 2, 1]
+        s = np.sqrt(squares[np.arange(len(m)), pivot])
+        products = np.stack([np.stack([s * s, wx, wy, wz], axis=-1),
+                             np.stack([wx, s * s, xy, xz], axis=-1),
+                             np.stack([wy, xy, s * s, yz], axis=-1),
+                             np.stack([wz, xz, yz, s * s], axis=-1)], axis=1)
+        q = products[np.arange(len(m)), pivot] / (2 * s[:, None])
+        q *= np.where(q[:, :1] < 0, -1.0, 1.0)
+        return QuaternionArray._from_array(q)
+
+    def __str__(self):
+        """
+        Returns a string representation of the QuaternionArray object.
+        """
+        return "[" + ", ".join(map(str, self)) + "]"
+
+if __name__ == "__main__":
+    # Example usage:
+    rotations = QuaternionArray(array=[[0.7071067811865476, 0, 0, 0.7071067811865476]])  # 90 degrees about z
+    print(rotations.rotate([[1, 0, 0], [0, 1, 0]]).round(6))  # Output: [[-0.  1.  0.] [-1. -0.  0.]]
@@ -0,0 +1,202 @@
+import numpy as np
+from .matrix import Matrix
+
+
+class SparseMatrix:
+    def __init__(self, rows, cols, row_indices=(), col_indices=(), values=()):
+        """
+        Initializes a SparseMatrix object of shape `rows` x `cols` from coordinate (COO) triplets.
+
+        The entries are stored in compressed sparse row (CSR) form: `indptr` holds where each row starts in
+        `indices` (column numbers) and `values`. Duplicate coordinates are summed and zeros are dropped.
+        """
+        self.rows = rows
+        self.cols = cols
+        row_indices = np.asarray(row_indices, dtype=np.intp)
+        col_indices = np.asarray(col_indices, dtype=np.intp)
+        values = np.asarray(values)
+        if not (row_indices.shape == col_indices.shape == values.shape):
+            raise ValueError("row_indices, col_indices and values must have the same length")
+        if len(values) and (row_indices.min() < 0 or row_indices.max() >= rows
+                            or col_indices.min() < 0 or col_indices.max() >= cols):
+            raise ValueError("Entry coordinates are out of range")
+        self.indptr, self.indices, self.values = self._coo_to_csr(rows, cols, row_indices, col_indices, values)
+
+    @staticmethod
+    def _coo_to_csr(rows, cols, row_indices, col_indices, values):
+        """
+        Sorts COO triplets by (row, column), sums duplicates and drops zeros.
+
+        Returns:
+        - csr (tuple): (indptr, indices, values) arrays.
+        """
+        keys = row_indices.astype(np.int64) * cols + col_indices
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        values = values[order]
+        if len(keys):
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            values = np.add.reduceat(values, starts)
+            keys = keys[starts]
+            nonzero = values != 0
+            keys, values = keys[nonzero], values[nonzero]
+        row_of_entry = keys // cols
+        indptr = np.zeros(rows + 1, dtype=np.intp)
+        np.cumsum(np.bincount(row_of_entry, minlength=rows), out=indptr[1:])
+        return indptr, (keys % cols).astype(np.intp), values
+
+    @classmethod
+    def _from_csr(cls, rows, cols, indptr, indices, values):
+        """
+        Wraps already canonical CSR arrays in a new SparseMatrix object without copying them.
+        """
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix.indptr = indptr
+        matrix.indices = indices
+        matrix.values = values
+        return matrix
+
+    @staticmethod
+    def from_matrix(matrix):
+        """
+        Creates a SparseMatrix object holding the nonzero elements of a dense Matrix object.
+        """
+        dense = np.asarray(matrix._array).reshape(matrix.rows, matrix.cols)
+        row_indices, col_indices = np.nonzero(dense)
+        return SparseMatrix(matrix.rows, matrix.cols, row_indices, col_indices, dense[row_indices, col_indices])
+
+    def to_matrix(self):
+        """
+        Returns a dense Matrix object with the same elements.
+        """
+        dense = np.zeros((self.rows, self.cols), dtype=self.values.dtype)
+        dense[self._row_of_entries(), self.indices] = self.values
+        return Matrix._from_array(dense, self.rows, self.cols)
+
+    @property
+    def nnz(self):
+        """
+        Returns the number of stored nonzero elements.
+        """
+        return len(self.values)
+
+    def _row_of_entries(self):
+        """
+        Returns the row number of every stored entry (the COO row indices).
+        """
+        return np.repeat(np.arange(self.rows), np.diff(self.indptr))
+
+    def _combine(self, other, sign):
+        """
+        Adds `sign` times `other` to the matrix by merging both sets of COO triplets.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrices must have the same dimensions for addition")
+        row_indices = np.concatenate([self._row_of_entries(), other._row_of_entries()])
+        col_indices = np.concatenate([self.indices, other.indices])
+        values = np.concatenate([self.values, sign * other.values])
+        return SparseMatrix(self.rows, self.cols, row_indices, col_indices, values)
+
+    def __add__(self, other):
+        """
+        Adds two SparseMatrix objects and returns a new SparseMatrix object with the result.
+        Raises a ValueError if matrices have different dimensions.
+        """
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        """
+        Subtracts one SparseMatrix object from another and returns a new SparseMatrix object with the result.
+        Raises a ValueError if matrices have different dimensions.
+        """
+        return self._combine(other, -1)
+
+    def __mul__(self, other):
+        """
+        Multiplies the matrix by a number, a dense vector (list or 1-D ndarray), a Matrix object or another
+        SparseMatrix object. The cost grows with the number of nonzeros, not with rows x cols.
+
+        Returns:
+        - result: SparseMatrix for numbers and SparseMatrix operands, ndarray for vectors, Matrix for Matrix operands.
+        """
+        if isinstance(other, (int, float)):
+            return SparseMatrix._from_csr(self.rows, self.cols, self.indptr, self.indices, self.values * other)
+        if isinstance(other, SparseMatrix):
+            return self._matmul_sparse(other)
+        if isinstance(other, Matrix):
+            if self.cols != other.rows:
+                raise ValueError("Matrices must be compatible for multiplication")
+            dense = np.asarray(other._array).reshape(other.rows, other.cols)
+            return Matrix._from_array(self._matmul_dense(dense), self.rows, other.cols)
+        vector = np.asarray(other)
+        if vector.ndim != 1 or len(vector) != self.cols:
+            raise ValueError("Vector length must match the number of columns")
+        # The same row-segment sums as a one-column dense product, in the result type of values and vector
+        return self._matmul_dense(vector[:, None])[:, 0]
+
+    def __rmul__(self, other):
+        """
+        Scales the matrix by a number, or multiplies a dense Matrix object on the left of it.
+        """
+        if isinstance(other, (int, float)):
+            return self * other
+        if isinstance(other, Matrix):
+            if other.cols != self.rows:
+                raise ValueError("Matrices must be compatible for multiplication")
+            dense = np.asarray(other._array).reshape(other.rows, other.cols)
+            # D x S == (S^T x D^T)^T
+            product = self.transpose()._matmul_dense(np.ascontiguousarray(dense.T)).T
+            return Matrix._from_array(np.ascontiguousarray(product), other.rows, self.cols)
+        return NotImplemented
+
+    def _matmul_dense(self, dense):
+        """
+        Multiplies the matrix by a dense 2-D ndarray and returns the dense ndarray product.
+        """
+        result = np.zeros((self.rows, dense.shape[1]), dtype=np.result_type(self.values, dense))
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if len(nonempty):
+            products = self.values[:, None] * dense[self.indices]
+            result[nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=0)
+        return result
+
+    def _matmul_sparse(self, other):
+        """
+        Multiplies two SparseMatrix objects: every entry A[i, k] is expanded against row k of `other`
+        and the partial products are summed by coordinate.
+        """
+        if self.cols != other.rows:
+            raise ValueError("Matrices must be compatible for multiplication")
+        row_lengths = np.diff(other.indptr)[self.indices]
+        total = int(row_lengths.sum())
+        if total == 0:
+            return SparseMatrix(self.rows, other.cols)
+        # Position of each expanded product within the row of `other` it comes from
+        offsets = np.arange(total) - np.repeat(np.cumsum(row_lengths) - row_lengths, row_lengths)
+        positions = np.repeat(other.indptr[self.indices], row_lengths) + offsets
+        row_indices = np.repeat(self._row_of_entries(), row_lengths)
+        values = np.repeat(self.values, row_lengths) * other.values[positions]
+        return SparseMatrix(self.rows, other.cols, row_indices, other.indices[positions], values)
+
+    def transpose(self):
+        """
+        Returns the transpose as a new SparseMatrix object.
+        """
+        order = np.argsort(self.indices, kind='stable')
+        indptr = np.zeros(self.cols + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.indices, minlength=self.cols), out=indptr[1:])
+        return SparseMatrix._from_csr(self.cols, self.rows, indptr, self._row_of_entries()[order], self.values[order])
+
+    def __str__(self):
+        """
+        Returns a string representation of the SparseMatrix object, one "(row, col)\tvalue" line per nonzero.
+        """
+        return "\n".join(f"({i}, {j})\t{v}" for i, j, v in
+                         zip(self._row_of_entries().tolist(), self.indices.tolist(), self.values.tolist()))
+
+if __name__ == "__main__":
+    # Example usage:
+    sparse = SparseMatrix(3, 3, [0, 1, 2], [0, 2, 1], [4, 5, 6])
+    print(sparse * [1, 2, 3])  # Output: [ 4. 15. 12.]
@@ -0,0 +1,260 @@
+from array import array
+from operator import add, mul, sub
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to element-by-element loops over the array('d') buffer
+    np = None
+
+from .vector import Vector
+
+
+class VectorArray:
+    def __init__(self, vectors=None, x=None, y=None):
+        """
+        Initializes a VectorArray from an iterable of Vector objects, or from the coordinate sequences `x` and `y`.
+
+        The vectors are stored in one contiguous float64 buffer with interleaved coordinates (x0, y0, x1, y1, ...).
+        """
+        if vectors is not None:
+            data = array('d')
+            for vector in vectors:
+                data.append(vector.x)
+                data.append(vector.y)
+        else:
+            x = [] if x is None else x
+            y = [] if y is None else y
+            if len(x) != len(y):
+                raise ValueError("x and y must have the same length")
+            data = array('d', bytes(16 * len(x)))
+            data[0::2] = array('d', x)
+            data[1::2] = array('d', y)
+        self._data = data
+
+    @classmethod
+    def _from_buffer(cls, data):
+        """
+        Wraps an existing interleaved array('d') buffer without copying it.
+        """
+        vectors = cls.__new__(cls)
+        vectors._data = data
+        return vectors
+
+    @classmethod
+    def zeros(cls, n):
+        """
+        Returns a VectorArray of `n` zero vectors.
+        """
+        return cls._from_buffer(array('d', bytes(16 * n)))
+
+    def _view(self):
+        """
+        Returns an (n, 2) NumPy view of the buffer (no copy).
+        """
+        return np.frombuffer(self._data, dtype=np.float64).reshape(-1, 2)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Returns the vectors as an (n, 2) float64 NumPy array sharing this buffer, or a copy when NumPy asks for one
+        (`copy=True`, as `np.array(vectors)` does) or another dtype is requested.
+        """
+        view = self._view()
+        if dtype is not None and np.dtype(dtype) != view.dtype:
+            if copy is False:
+                raise ValueError("Converting a VectorArray to another dtype requires a copy")
+            return view.astype(dtype)
+        return view.copy() if copy else view
+
+    def __buffer__(self, flags):
+        """
+        Exposes the interleaved float64 buffer, so `memoryview(vectors)` wraps it without copying.
+
+        Python only honours `__buffer__` from version 3.12 on; on older versions `memoryview(vectors)` raises a
+        TypeError and the `buffer` property gives the same memoryview.
+        """
+        return memoryview(self._data)
+
+    @property
+    def buffer(self):
+        """
+        Returns a memoryview of the interleaved float64 buffer (no copy).
+        """
+        return memoryview(self._data)
+
+    @property
+    def x(self):
+        """
+        Returns the x coordinates (a NumPy view when NumPy is available, a new array otherwise).
+        """
+        return self._view()[:, 0] if np is not None else self._data[0::2]
+
+    @property
+    def y(self):
+        """
+        Returns the y coordinates (a NumPy view when NumPy is available, a new array otherwise).
+        """
+        return self._view()[:, 1] if np is not None else self._data[1::2]
+
+    def __len__(self):
+        """
+        Returns the number of vectors.
+        """
+        return len(self._data) // 2
+
+    def __getitem__(self, i):
+        """
+        Returns vector `i` as a Vector object.
+        """
+        if not -len(self) <= i < len(self):
+            raise IndexError("VectorArray index out of range")
+        i %= len(self)
+        return Vector(self._data[2 * i], self._data[2 * i + 1])
+
+    def __setitem__(self, i, vector):
+        """
+        Sets vector `i` from a Vector object.
+        """
+        if not -len(self) <= i < len(self):
+            raise IndexError("VectorArray index out of range")
+        i %= len(self)
+        self._data[2 * i] = vector.x
+        self._data[2 * i + 1] = vector.y
+
+    def __iter__(self):
+        """
+        Iterates over the vectors as Vector objects.
+        """
+        data = self._data
+        for i in range(0, len(data), 2):
+            yield Vector(data[i], data[i + 1])
+
+    def _operand(self, other):
+        """
+        Returns `other` as something that broadcasts against the (n, 2) view, or as an interleaved sequence.
+        """
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArrays must have the same length")
+            return other._view() if np is not None else other._data
+        if isinstance(other, Vector):
+            return np.array([other.x, other.y]) if np is not None else [other.x, other.y] * len(self)
+        return None
+
+    def _binary(self, other, op, out=None):
+        """
+        Applies `op` elementwise against a VectorArray or a single Vector, writing into `out` (a VectorArray).
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if out is None:
+            out = VectorArray.zeros(len(self))
+        if np is not None:
+            op(self._view(), operand, out=out._view())
+        else:
+            out._data[:] = array('d', map(op, self._data, operand))
+        return out
+
+    def __add__(self, other):
+        """
+        Adds a VectorArray (elementwise) or a Vector (to every vector) and returns a new VectorArray.
+        """
+        return self._binary(other, np.add if np is not None else add)
+
+    def __sub__(self, other):
+        """
+        Subtracts a VectorArray (elementwise) or a Vector (from every vector) and returns a new VectorArray.
+        """
+        return self._binary(other, np.subtract if np is not None else sub)
+
+    def __iadd__(self, other):
+        """
+        Adds a VectorArray or a Vector in place.
+        """
+        return self._binary(other, np.add if np is not None else add, out=self)
+
+    def __isub__(self, other):
+        """
+        Subtracts a VectorArray or a Vector in place.
+        """
+        return self._binary(other, np.subtract if np is not None else sub, out=self)
+
+    def __mul__(self, scalar):
+        """
+        Multiplies every vector by a number and returns a new VectorArray.
+        """
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        out = VectorArray.zeros(len(self))
+        if np is not None:
+            np.multiply(self._view(), scalar, out=out._view())
+        else:
+            out._data[:] = array('d', map(mul, self._data, repeat(scalar)))
+        return out
+
+    __rmul__ = __mul__
+
+    def __imul__(self, scalar):
+        """
+        Multiplies every vector by a number in place.
+        """
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        if np is not None:
+            self._view()[...] *= scalar
+        else:
+            self._data[:] = array('d', map(mul, self._data, repeat(scalar)))
+        return self
+
+    def dot(self, other):
+        """
+        Computes the dot product of every vector with the matching vector of a VectorArray, or with one Vector.
+
+        Returns:
+        - dots: NumPy array (or list without NumPy) with one dot product per vector.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("dot expects a VectorArray or a Vector")
+        if np is not None:
+            view = self._view()
+            return np.einsum('ij,ij->i', view, np.broadcast_to(operand, view.shape))
+        products = list(map(mul, self._data, operand))
+        return [products[i] + products[i + 1] for i in range(0, len(products), 2)]
+
+    def norms(self):
+        """
+        Returns the Euclidean length of every vector (NumPy array, or list without NumPy).
+        """
+        if np is not None:
+            view = self._view()
+            return np.hypot(view[:, 0], view[:, 1])
+        data = self._data
+        return [(data[i] ** 2 + data[i + 1] ** 2) ** 0.5 for i in range(0, len(data), 2)]
+
+    def normalize(self):
+        """
+        Returns a new VectorArray of unit vectors; zero vectors stay zero.
+        """
+        out = VectorArray.zeros(len(self))
+        if np is not None:
+            lengths = self.norms()
+            np.divide(self._view(), lengths[:, None], out=out._view(), where=lengths[:, None] != 0)
+        else:
+            lengths = self.norms()
+            out._data[:] = array('d', (value / lengths[i // 2] if lengths[i // 2] else 0.0
+                                       for i, value in enumerate(self._data)))
+        return out
+
+    def __str__(self):
+        """
+        Returns a string representation of the VectorArray object.
+        """
+        return "[" + ", ".join(map(str, self)) + "]"
+
+if __name__ == "__main__":
+    # Example usage:
+    vectors = VectorArray([Vector(1, 2), Vector(3, 4)])
+    print(vectors + Vector(1, 1))   # Output: [<2.0, 3.0>, <4.0, 5.0>]
+    print(vectors.dot(vectors))     # Output: [ 5. 25.]